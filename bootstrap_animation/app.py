@@ -3,26 +3,56 @@ Main Dash Application for Bootstrap Animation
 Animated visualization of Shapland's ODP Bootstrap Methodology
 """
 
+import functools
+
 import dash
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output, State
+import chainladder as cl
 
 from bootstrap_engine import AnimatedBootstrapODP
 from visualization import BootstrapVisualizer
 from callbacks import register_callbacks
 
 
+# chainladder sample name for each dataset dropdown value
+SAMPLE_DATASETS = {
+    'genins': 'genins',
+    'raa': 'raa',
+    'abc': 'abc',
+    'quarterly': 'quarterly',
+    'ukmotor': 'ukmotor',
+    'mw2008': 'MW2008',
+    'mw2014': 'MW2014',
+}
+
+
+@functools.lru_cache(maxsize=16)
+def load_triangle(dataset_name: str) -> cl.Triangle:
+    """Load a chainladder sample triangle once per dataset."""
+    return cl.load_sample(SAMPLE_DATASETS.get(dataset_name, 'genins'))
+
+
+@functools.lru_cache(maxsize=8)
+def get_engine(dataset_name: str) -> AnimatedBootstrapODP:
+    """Build the bootstrap engine for a dataset once and reuse it on later switches."""
+    return AnimatedBootstrapODP(triangle_data=load_triangle(dataset_name), random_state=42)
+
+
+@functools.lru_cache(maxsize=8)
+def get_visualizer(dataset_name: str) -> BootstrapVisualizer:
+    """Visualizer sized to the dataset's triangle."""
+    return BootstrapVisualizer(get_engine(dataset_name).get_triangle_metadata())
+
+
 # Initialize the bootstrap engine with sample data
 print("Initializing bootstrap engine...")
-bootstrap_engine = AnimatedBootstrapODP(random_state=42)
+bootstrap_engine = get_engine('genins')
 metadata = bootstrap_engine.get_triangle_metadata()
 print(f"Triangle loaded: {metadata['n_origin']} origins × {metadata['n_dev']} development periods")
 print(f"Base reserve estimate: ${metadata['base_reserve']:,.0f}")
 
-# Initialize visualizer
-visualizer = BootstrapVisualizer(metadata)
-
 # Initialize Dash app with Bootstrap theme
 app = dash.Dash(
     __name__,
@@ -282,6 +312,7 @@ app.layout = dbc.Container([
 
     # Store for triangle display mode
     dcc.Store(id='triangle-mode-store', data='cumulative'),
+    dcc.Store(id='actual-triangle-cache'),
 
     # Hidden components for state management
     dcc.Store(id='iteration-store', data={
@@ -289,9 +320,26 @@ app.layout = dbc.Container([
         'current_iteration': 0,
         'current_frame': 0,
         'n_iterations': 100,
-        'bootstrap_complete': False
+        'bootstrap_complete': False,
+        'run_all': False
     }),
 
+    # First Play of a run: asks the server to resample before playback starts
+    dcc.Store(id='play-request-store'),
+
+    # Cell-by-cell animation: per-iteration payload and the last rendered frame
+    dcc.Store(id='animation-payload-store'),
+    dcc.Store(id='cell-frame-store'),
+
+    # Interval ticks the browser passes on to the server (Run All batches only)
+    dcc.Store(id='server-tick-store'),
+
+    # Playback interval set by the speed slider (the throttle may run slower)
+    dcc.Store(id='speed-interval-store'),
+
+    # Browser tab visibility (playback pauses its interval while hidden)
+    dcc.Store(id='tab-visible', data=True),
+
     dcc.Interval(
         id='interval-component',
         interval=100,  # milliseconds
@@ -315,7 +363,7 @@ app.layout = dbc.Container([
 
 
 # Register callbacks
-register_callbacks(app, bootstrap_engine, visualizer)
+register_callbacks(app, get_engine, get_visualizer)
 
 
 if __name__ == '__main__':
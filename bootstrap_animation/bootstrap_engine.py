@@ -3,10 +3,74 @@ Bootstrap Engine for Shapland ODP Bootstrap Methodology
 Uses chainladder's BootstrapODPSample for correct implementation
 """
 
+import functools
+import threading
+
 import numpy as np
 import chainladder as cl
 from chainladder import BootstrapODPSample
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Percentiles reported in bootstrap summaries
+PERCENTILE_LEVELS = (5, 25, 50, 75, 95)
+
+
+def _make_reserve_kernel(observed: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build a chain ladder reserve kernel specialised to one triangle layout.
+
+    Resampled triangles share the observed-cell pattern of the triangle they come
+    from, so the development pairs and latest-diagonal positions are fixed when the
+    kernel is built; each call only does the arithmetic. Volume-weighted age-to-age
+    factors without a tail, matching cl.Chainladder() defaults.
+
+    Parameters:
+    -----------
+    observed : np.ndarray
+        Boolean (n_origin, n_dev) mask of observed cells
+
+    Returns:
+    --------
+    Callable mapping cumulative triangles (n_triangles, n_origin, n_dev), NaN
+    outside the observed cells, to total reserves of shape (n_triangles,).
+    float32 input is accumulated in float64, so reserves keep full precision.
+    """
+    observed = np.asarray(observed, dtype=bool)
+
+    # Origins observed at both k and k + 1 weight the age-to-age factor of k
+    pair_weights = (observed[:, 1:] & observed[:, :-1]).astype(np.float64)
+
+    # (origin, dev) position of every origin's latest diagonal cell
+    origin_idx = np.arange(observed.shape[0])
+    latest_idx = np.maximum(observed.sum(axis=1) - 1, 0)
+
+    def reserve_kernel(cumulative: np.ndarray) -> np.ndarray:
+        values = np.where(observed, cumulative, 0).astype(np.float64)
+
+        numerator = np.einsum('...ij,ij->...j', values[..., 1:], pair_weights)
+        denominator = np.einsum('...ij,ij->...j', values[..., :-1], pair_weights)
+        ldf = np.divide(numerator, denominator, out=np.ones_like(numerator), where=denominator > 0)
+
+        # Age-to-ultimate factors, 1.0 at the last development period
+        cdf = np.cumprod(ldf[..., ::-1], axis=-1)[..., ::-1]
+        cdf = np.concatenate([cdf, np.ones_like(cdf[..., :1])], axis=-1)
+
+        # Latest diagonal (one fancy index) and the age-to-ultimate factor at its development period
+        latest = values[..., origin_idx, latest_idx]
+        latest_cdf = cdf[..., latest_idx]
+
+        return (latest * (latest_cdf - 1.0)).sum(axis=-1)
+
+    return reserve_kernel
+
+
+def _synchronized(method: Callable) -> Callable:
+    """Run an engine method holding the engine's lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class AnimatedBootstrapODP:
@@ -30,6 +94,11 @@ class AnimatedBootstrapODP:
         """
         self.random_state = random_state
 
+        # Runs and recorded details may be read and extended from several threads
+        # (the app's request threads and its figure prefetch); re-entrant, as
+        # recording methods call each other
+        self._lock = threading.RLock()
+
         # Load triangle data
         if triangle_data is None:
             self.triangle = cl.load_sample('genins')
@@ -47,106 +116,419 @@ class AnimatedBootstrapODP:
         n_dev_orig = self.actual_incremental.shape[3]
         self.fitted_incremental = self.fitted_incremental.iloc[:, :, :, :n_dev_orig]
 
-        # Storage for bootstrap results
+        # Raw arrays extracted once; Triangle.values is not free on hot paths
+        self._actual_cum_arr = np.ascontiguousarray(self.triangle.values[0, 0])
+        self._actual_incr_arr = np.ascontiguousarray(self.actual_incremental.values[0, 0])
+        self._fitted_incr_arr = np.ascontiguousarray(self.fitted_incremental.values[0, 0])
+        self._latest_diag_arr = self.triangle.latest_diagonal.values[0, 0, :, 0].copy()
+        self._ultimate_arr = self.base_model.ultimate_.values[0, 0, :, -1].copy()
+
+        # Reserve kernel specialised to this triangle's layout, reused by every batch
+        self._reserve_kernel = _make_reserve_kernel(~np.isnan(self._actual_cum_arr))
+
+        # Storage for bootstrap results (reserves live in a preallocated buffer)
         self.iteration_details = []
-        self.reserve_estimates = []
+        self._details_by_iteration = {}
+        self._reserves = np.empty(0)
+        self._reserve_prefix = np.zeros((1, 2))
+        self._n_processed = 0
         self.scale_parameter = None
-        self.residual_pool = []  # Populated via residual preparation
-        self._residual_adjusted_values = np.array([])
+        self._resampled_cumulative = None
         self._prepare_residual_pool()
 
+        # Invariants of the engine, cached for metadata requests and per-tick callbacks
+        self.base_reserve = self._calculate_base_reserve()
+        self._origin_labels = [str(x) for x in self.triangle.origin.values]
+        self._development_labels = [str(x) for x in self.triangle.development.values]
+
     def _calculate_base_reserve(self) -> float:
         """Calculate base reserve estimate from chain ladder."""
-        ultimate = self.base_model.ultimate_.values[0, 0, :, -1]
-        latest = self.triangle.latest_diagonal.values[0, 0, :, 0]
-        return np.sum(ultimate - latest)
+        return np.sum(self._ultimate_arr - self._latest_diag_arr)
 
     def get_triangle_metadata(self) -> Dict:
         """Get metadata about the triangle for visualization."""
-        n_origin = self.triangle.shape[2]
-        n_dev = self.triangle.shape[3]
+        n_origin, n_dev = self._actual_cum_arr.shape
 
         return {
             'n_origin': n_origin,
             'n_dev': n_dev,
-            'base_reserve': self._calculate_base_reserve(),
-            'actual_cumulative': self.triangle.values[0, 0],
-            'actual_incremental': self.actual_incremental.values[0, 0],
-            'fitted_incremental': self.fitted_incremental.values[0, 0],
+            'base_reserve': self.base_reserve,
+            'actual_cumulative': self._actual_cum_arr,
+            'actual_incremental': self._actual_incr_arr,
+            'fitted_incremental': self._fitted_incr_arr,
             'residuals': self._get_residuals(),
             'residual_pool': self.residual_pool,
-            'origin_labels': [str(x) for x in self.triangle.origin.values],
-            'development_labels': [str(x) for x in self.triangle.development.values]
+            'origin_labels': self._origin_labels,
+            'development_labels': self._development_labels
         }
 
     def _prepare_residual_pool(self) -> None:
         """Prepare residual pool and related helpers for visualization."""
-        actual = self.actual_incremental.values[0, 0]
-        fitted = self.fitted_incremental.values[0, 0]
+        actual = self._actual_incr_arr
+        fitted = self._fitted_incr_arr
+
+        # Loop invariants: observed (upper-triangle) cells and sqrt(|fitted|)
+        n_origin, n_dev = fitted.shape
+        origin_idx, dev_idx = np.indices((n_origin, n_dev))
+        self._upper_mask = origin_idx + dev_idx < n_origin
+        self._sqrt_abs_fitted = np.sqrt(np.abs(fitted))
+        self._fitted_masked_pos = (fitted > 0) & self._upper_mask
 
         with np.errstate(divide='ignore', invalid='ignore'):
-            standardized_residuals = (actual - fitted) / np.sqrt(np.abs(fitted))
+            standardized_residuals = (actual - fitted) / self._sqrt_abs_fitted
             standardized_residuals = np.nan_to_num(
                 standardized_residuals, nan=0.0, posinf=0.0, neginf=0.0
             )
 
         self.unscaled_residuals = standardized_residuals
 
-        n_origin, n_dev = standardized_residuals.shape
-        residual_entries = []
-        residual_values = []
-
-        for origin in range(n_origin):
-            for dev in range(n_dev):
-                if origin + dev >= n_origin:
-                    continue  # Outside observed triangle
-
-                value = standardized_residuals[origin, dev]
-                if fitted[origin, dev] <= 0 or not np.isfinite(value) or value == 0:
-                    continue
+        # Observed, positive-fitted, finite and non-zero residuals form the pool
+        mask = (
+            self._fitted_masked_pos
+            & np.isfinite(standardized_residuals)
+            & (standardized_residuals != 0)
+        )
+
+        # Residual pool stored as parallel arrays (struct-of-arrays)
+        self._pool_origin = origin_idx[mask].astype(np.int32)
+        self._pool_dev = dev_idx[mask].astype(np.int32)
+        self._pool_residual = standardized_residuals[mask]
+        self._residual_adjusted_values = (
+            self._pool_residual - self._pool_residual.mean()
+            if self._pool_residual.size else np.array([])
+        )
+        self._residual_pool_cache = None
+
+        # Pool position of each (origin, dev) cell for O(1) lookups
+        self._pool_index = {
+            cell: idx for idx, cell in enumerate(zip(self._pool_origin.tolist(), self._pool_dev.tolist()))
+        }
 
-                residual_entries.append({
+        # Sorted float32 copy of the adjusted residuals for nearest-neighbour lookups
+        self._sorted_order = np.argsort(self._residual_adjusted_values, kind='stable')
+        self._sorted_adjusted = self._residual_adjusted_values[self._sorted_order].astype(np.float32)
+
+        # Upper-triangle cells shown in the sampling animation (same for every iteration)
+        self._upper_origin_arr = origin_idx[self._upper_mask]
+        self._upper_dev_arr = dev_idx[self._upper_mask]
+        self._upper_origin_arr.setflags(write=False)  # shared by every iteration's sampling arrays
+        self._upper_dev_arr.setflags(write=False)
+        self._upper_origin = self._upper_origin_arr.tolist()
+        self._upper_dev = self._upper_dev_arr.tolist()
+        self._fitted_upper = fitted[self._upper_mask].astype(np.float32)
+        self._fitted_upper_positive = self._fitted_masked_pos[self._upper_mask]
+        self._sqrt_abs_fitted_upper = self._sqrt_abs_fitted[self._upper_mask].astype(np.float32)
+
+    @property
+    def residual_pool(self) -> List[Dict]:
+        """Residual pool as a list of per-cell dicts, built on first access."""
+        if self._residual_pool_cache is None:
+            self._residual_pool_cache = [
+                {
                     'origin': origin,
                     'dev': dev,
-                    'standardized_residual': value
-                })
-                residual_values.append(value)
-
-        if not residual_entries:
-            self.residual_pool = []
-            self._residual_adjusted_values = np.array([])
-            return
-
-        residual_values = np.array(residual_values)
-        mean_adjusted = float(np.mean(residual_values)) if residual_values.size else 0.0
-
-        adjusted_values = []
-        for entry in residual_entries:
-            adjusted = entry['standardized_residual'] - mean_adjusted
-            entry['adjusted_residual'] = adjusted
-            adjusted_values.append(adjusted)
-
-        self.residual_pool = residual_entries
-        self._residual_adjusted_values = np.array(adjusted_values)
+                    'standardized_residual': value,
+                    'adjusted_residual': adjusted
+                }
+                for origin, dev, value, adjusted in zip(
+                    self._pool_origin.tolist(),
+                    self._pool_dev.tolist(),
+                    self._pool_residual,
+                    self._residual_adjusted_values
+                )
+            ]
+        return self._residual_pool_cache
+
+    def residual_pool_index(self, origin, dev) -> Optional[int]:
+        """Position of the (origin, dev) cell in the residual pool, or None if it is not in the pool."""
+        return self._pool_index.get((origin, dev))
 
     def _get_residuals(self):
         """Return unscaled Pearson residuals for display."""
         return getattr(self, 'unscaled_residuals', None)
 
     def _find_residual_match(self, residual_value: float):
-        """Find index and entry in residual pool matching residual_value."""
-        if not self.residual_pool or self._residual_adjusted_values.size == 0:
-            return None, None
+        """Find index, origin and dev of the pool residual matching residual_value."""
+        match_idx = int(self._find_residual_matches(np.array([residual_value]))[0])
+        if match_idx < 0:
+            return None, None, None
+        return match_idx, int(self._pool_origin[match_idx]), int(self._pool_dev[match_idx])
+
+    def _find_residual_matches(self, residual_values: np.ndarray) -> np.ndarray:
+        """
+        Pool index of the closest adjusted residual to each value, -1 where there is no match.
+
+        Binary search on the sorted pool; ties go to the lowest pool index.
+        """
+        if self._sorted_adjusted.size == 0:
+            return np.full(residual_values.shape, -1)
+
+        sorted_adj = self._sorted_adjusted
+        pos = np.searchsorted(sorted_adj, residual_values)
+
+        # Candidates either side of the insertion point (first of any run of equal values)
+        right = np.minimum(pos, sorted_adj.size - 1)
+        left = np.searchsorted(sorted_adj, sorted_adj[np.maximum(pos - 1, 0)])
+        d_left = np.abs(residual_values - sorted_adj[left])
+        d_right = np.abs(residual_values - sorted_adj[right])
+
+        left_idx = self._sorted_order[left]
+        right_idx = self._sorted_order[right]
+        use_right = (d_right < d_left) | ((d_right == d_left) & (right_idx < left_idx))
+        match_idx = np.where(use_right, right_idx, left_idx)
 
-        diffs = np.abs(self._residual_adjusted_values - residual_value)
-        match_idx = int(np.argmin(diffs))
-        match_entry = self.residual_pool[match_idx]
         # Provide graceful handling when difference is significantly large
-        if not np.isfinite(diffs[match_idx]):
-            return None, None
-        return match_idx, match_entry
+        finite = np.isfinite(np.where(use_right, d_right, d_left))
+        return np.where(finite, match_idx, -1)
+
+    def _build_iteration_detail(
+        self,
+        iteration_num: int,
+        bootstrap_cumulative: np.ndarray,
+        bootstrap_incremental: np.ndarray,
+        reserve: float
+    ) -> Dict:
+        """Build the animation details of one bootstrap iteration."""
+        fitted_upper = self._fitted_upper
+        bootstrap_upper = bootstrap_incremental[self._upper_mask]
+
+        # Implied residual of every cell, matched against the pool in one pass
+        sampled_residuals = np.zeros_like(fitted_upper)
+        np.divide(
+            bootstrap_upper - fitted_upper, self._sqrt_abs_fitted_upper,
+            out=sampled_residuals, where=self._fitted_upper_positive
+        )
+        match_idx_arr = self._find_residual_matches(sampled_residuals)
+        match_idx = match_idx_arr.tolist()
+        pool_origin = self._pool_origin
+        pool_dev = self._pool_dev
+
+        # Create sampling details (simplified - just show bootstrap values)
+        sampling_details = [
+            {
+                'origin': ii,
+                'dev': jj,
+                'fitted': fitted_value,
+                'bootstrap_value': bootstrap_value,
+                'sampled_from_origin': int(pool_origin[k]) if k >= 0 else None,
+                'sampled_from_dev': int(pool_dev[k]) if k >= 0 else None,
+                'sampled_residual': sampled_residual,
+                'sampled_residual_index': k if k >= 0 else None,
+                'sequence': seq
+            }
+            for seq, (ii, jj, fitted_value, bootstrap_value, sampled_residual, k) in enumerate(zip(
+                self._upper_origin, self._upper_dev, fitted_upper, bootstrap_upper, sampled_residuals, match_idx
+            ))
+        ]
+
+        # The same samples as parallel arrays (struct-of-arrays), for consumers that
+        # scan a whole iteration; sampled_residual_index is -1 where nothing matched
+        sampling_arrays = {
+            'origin': self._upper_origin_arr,
+            'dev': self._upper_dev_arr,
+            'fitted': fitted_upper,
+            'bootstrap_value': bootstrap_upper,
+            'sampled_residual': sampled_residuals,
+            'sampled_residual_index': match_idx_arr
+        }
+
+        return {
+            'iteration': iteration_num,
+            'bootstrap_incremental': bootstrap_incremental,
+            'bootstrap_cumulative': bootstrap_cumulative,
+            'reserve_estimate': reserve,
+            'sampling_details': sampling_details,
+            'sampling_arrays': sampling_arrays
+        }
+
+    @_synchronized
+    def prepare_bootstrap(self, n_iterations: int) -> None:
+        """
+        Resample bootstrap triangles with BootstrapODPSample without projecting them.
 
-    def run_bootstrap(self, n_iterations: int = 1000) -> Dict:
+        Clears previous results; iterations are then projected in batches with
+        process_iterations.
+
+        Parameters:
+        -----------
+        n_iterations : int
+            Number of bootstrap iterations to resample
+        """
+        self.reset_results()
+        self._resample(n_iterations)
+
+    @_synchronized
+    def reset_results(self) -> None:
+        """Discard processed iterations, keeping the resampled triangles."""
+        self.iteration_details = []
+        self._details_by_iteration = {}
+        self._n_processed = 0
+
+    @property
+    def n_processed(self) -> int:
+        """Number of iterations projected so far in the current run."""
+        return self._n_processed
+
+    @property
+    def reserve_estimates(self) -> np.ndarray:
+        """Reserves of the iterations processed so far (a view of the preallocated buffer)."""
+        return self._reserves[:self._n_processed]
+
+    @_synchronized
+    def reserve_moments(self, n: int) -> Tuple[float, float]:
+        """
+        Mean and standard deviation of the first n processed reserves.
+
+        Read from running sums kept by process_iterations, so the cost does not
+        grow with n.
+        """
+        n = min(n, self._n_processed)
+        if n <= 0:
+            return 0.0, 0.0
+        total, total_sq = self._reserve_prefix[n]
+        mean = total / n
+        return float(mean), float(np.sqrt(max(total_sq / n - mean * mean, 0.0)))
+
+    @_synchronized
+    def _resample(self, n_iterations: int) -> None:
+        """
+        Size the current run to n_iterations resampled triangles.
+
+        For a fixed random_state the first k resampled triangles do not depend on
+        n_sims, so resampling more iterations leaves already processed ones valid,
+        and BootstrapODPSample is only fitted again when a run needs more
+        triangles than any earlier one.
+        """
+        if self._resampled_cumulative is None or self._resampled_cumulative.shape[0] < n_iterations:
+            # Use chainladder's bootstrap implementation
+            bootstrap_sample = BootstrapODPSample(
+                n_sims=n_iterations,
+                random_state=self.random_state,
+                hat_adj=False  # Use degrees of freedom adjustment
+            ).fit(self.triangle)
+
+            # Store scale parameter
+            self.scale_parameter = bootstrap_sample.scale_
+
+            # Resampled cumulative triangles as one contiguous float32 (n_sims, n_origin, n_dev) tensor
+            self._resampled_cumulative = np.ascontiguousarray(
+                bootstrap_sample.resampled_triangles_.values[:, 0], dtype=np.float32
+            )
+
+        # One reserve slot per resampled triangle, keeping those already processed
+        reserves = np.empty(n_iterations)
+        reserves[:self._n_processed] = self._reserves[:self._n_processed]
+        self._reserves = reserves
+
+        # Running [sum, sum of squares] of the reserves; row k covers the first k
+        prefix = np.zeros((n_iterations + 1, 2))
+        prefix[:self._n_processed + 1] = self._reserve_prefix[:self._n_processed + 1]
+        self._reserve_prefix = prefix
+
+    @_synchronized
+    def process_iterations(
+        self,
+        n_batch: int,
+        record_details: bool = True,
+        record_iters: Optional[Iterable[int]] = None
+    ) -> int:
+        """
+        Project the next n_batch resampled triangles and record their reserves.
+
+        Parameters:
+        -----------
+        n_batch : int
+            Maximum number of iterations to process in this call
+        record_details : bool
+            Whether to keep per-iteration triangles and sampling details for animation
+        record_iters : Iterable[int], optional
+            Keep details only for these iteration numbers (overrides record_details)
+
+        Returns:
+        --------
+        int
+            Total number of iterations processed so far
+        """
+        start = self._n_processed
+        if self._resampled_cumulative is None:
+            return start
+        stop = min(start + n_batch, self._reserves.shape[0])
+        if stop <= start:
+            return start
+
+        # Cumulative triangles of the whole batch
+        batch_cumulative = self._resampled_cumulative[start:stop]
+
+        # Chain ladder reserves of the whole batch in a few tensor operations
+        batch_reserves = self._reserve_kernel(batch_cumulative)
+        self._reserves[start:stop] = batch_reserves
+        self._reserve_prefix[start + 1:stop + 1] = self._reserve_prefix[start] + np.cumsum(
+            np.column_stack((batch_reserves, batch_reserves * batch_reserves)), axis=0
+        )
+        self._n_processed = stop
+
+        if record_iters is not None:
+            recorded = sorted(set(record_iters).intersection(range(start, stop)))
+        elif record_details:
+            recorded = range(start, stop)
+        else:
+            return stop
+        if not recorded:
+            return stop
+
+        batch_incremental = np.diff(batch_cumulative, axis=-1, prepend=0)
+
+        # Sampling details only for the recorded iterations
+        for i in recorded:
+            self._record_detail(self._build_iteration_detail(
+                i, batch_cumulative[i - start], batch_incremental[i - start], batch_reserves[i - start]
+            ))
+
+        return stop
+
+    def _record_detail(self, detail: Dict) -> None:
+        """Keep an iteration's details, findable by iteration number."""
+        self.iteration_details.append(detail)
+        self._details_by_iteration[detail['iteration']] = detail
+
+    @_synchronized
+    def get_iteration_detail(self, iteration_num: int) -> Dict:
+        """
+        Details of a processed iteration, looked up by iteration number.
+
+        Iterations processed without details (e.g. by a bulk run) have them built
+        from the resampled tensor on first request, and recorded.
+
+        Parameters:
+        -----------
+        iteration_num : int
+            Iteration index, below n_processed
+
+        Returns:
+        --------
+        Dict with the bootstrap triangles, reserve estimate and sampling details
+        """
+        detail = self._details_by_iteration.get(iteration_num)
+        if detail is not None:
+            return detail
+        if not 0 <= iteration_num < self._n_processed:
+            raise IndexError(f"Iteration {iteration_num} has not been processed ({self._n_processed} so far)")
+
+        cumulative = self._resampled_cumulative[iteration_num]
+        detail = self._build_iteration_detail(
+            iteration_num, cumulative, np.diff(cumulative, axis=-1, prepend=0),
+            self._reserves[iteration_num]
+        )
+        self._record_detail(detail)
+        return detail
+
+    @_synchronized
+    def run_bootstrap(
+        self,
+        n_iterations: int = 1000,
+        record_details: bool = False,
+        record_iters: Optional[Iterable[int]] = None
+    ) -> Dict:
         """
         Run bootstrap using chainladder's BootstrapODPSample.
 
@@ -154,82 +536,22 @@ class AnimatedBootstrapODP:
         -----------
         n_iterations : int
             Number of bootstrap iterations to run
+        record_details : bool
+            Whether to keep per-iteration details for animation (off for bulk runs)
+        record_iters : Iterable[int], optional
+            Keep details only for these iteration numbers, e.g. range(10) for a preview
 
         Returns:
         --------
         Dict containing summary statistics
         """
-        # Use chainladder's bootstrap implementation
-        bootstrap_sample = BootstrapODPSample(
-            n_sims=n_iterations,
-            random_state=self.random_state,
-            hat_adj=False  # Use degrees of freedom adjustment
-        ).fit(self.triangle)
+        self.prepare_bootstrap(n_iterations)
+        self.process_iterations(n_iterations, record_details=record_details, record_iters=record_iters)
 
-        # Store scale parameter
-        self.scale_parameter = bootstrap_sample.scale_
+        reserves = self.reserve_estimates
 
-        # Get resampled triangles
-        resampled_triangles = bootstrap_sample.resampled_triangles_
-
-        # Process each bootstrap sample
-        self.iteration_details = []
-        self.reserve_estimates = []
-
-        for i in range(n_iterations):
-            # Get bootstrap triangle
-            boot_tri = resampled_triangles.iloc[i]
-
-            # Fit chain ladder and calculate reserve
-            boot_model = cl.Chainladder().fit(boot_tri)
-            ultimate = boot_model.ultimate_.values[0, 0, :, -1].sum()
-            latest = boot_tri.latest_diagonal.values[0, 0, :, 0].sum()
-            reserve = ultimate - latest
-
-            self.reserve_estimates.append(reserve)
-
-            # Store iteration details for animation
-            boot_incr = boot_tri.cum_to_incr().values[0, 0]
-            n_origin, n_dev = boot_incr.shape
-
-            # Create sampling details (simplified - just show bootstrap values)
-            sampling_details = []
-            for ii in range(n_origin):
-                for jj in range(n_dev):
-                    if ii + jj < n_origin:
-                        fitted_value = self.fitted_incremental.values[0, 0, ii, jj]
-                        bootstrap_value = boot_incr[ii, jj]
-
-                        if fitted_value > 0:
-                            sampled_residual = (bootstrap_value - fitted_value) / np.sqrt(
-                                np.abs(fitted_value)
-                            )
-                        else:
-                            sampled_residual = 0.0
-
-                        match_idx, match_entry = self._find_residual_match(sampled_residual)
-
-                        sampling_details.append({
-                            'origin': ii,
-                            'dev': jj,
-                            'fitted': fitted_value,
-                            'bootstrap_value': bootstrap_value,
-                            'sampled_from_origin': match_entry['origin'] if match_entry else None,
-                            'sampled_from_dev': match_entry['dev'] if match_entry else None,
-                            'sampled_residual': sampled_residual,
-                            'sampled_residual_index': match_idx,
-                            'sequence': len(sampling_details)
-                        })
-
-            self.iteration_details.append({
-                'iteration': i,
-                'bootstrap_incremental': boot_incr,
-                'bootstrap_cumulative': boot_tri.values[0, 0],
-                'reserve_estimate': reserve,
-                'sampling_details': sampling_details
-            })
-
-        reserves = np.array(self.reserve_estimates)
+        # All summary percentiles from a single partition pass
+        percentiles = np.percentile(reserves, PERCENTILE_LEVELS)
 
         return {
             'n_iterations': n_iterations,
@@ -238,22 +560,32 @@ class AnimatedBootstrapODP:
             'std': np.std(reserves),
             'min': np.min(reserves),
             'max': np.max(reserves),
-            'percentiles': {
-                '5': np.percentile(reserves, 5),
-                '25': np.percentile(reserves, 25),
-                '50': np.percentile(reserves, 50),
-                '75': np.percentile(reserves, 75),
-                '95': np.percentile(reserves, 95)
-            }
+            'percentiles': dict(zip(map(str, PERCENTILE_LEVELS), percentiles))
         }
 
-    def run_single_iteration(self, iteration_num: int):
+    @_synchronized
+    def run_single_iteration(self, iteration_num: int) -> Dict:
         """
-        Run a single bootstrap iteration.
-        This is a simplified version that just runs the full bootstrap.
-        For real-time animation, call run_bootstrap with n_iterations=1.
+        Get one bootstrap iteration, simulating further iterations only when needed.
+
+        The run is grown on a doubling schedule,
+        so stepping through iterations one at a time costs O(1) amortised.
+
+        Parameters:
+        -----------
+        iteration_num : int
+            Iteration index
+
+        Returns:
+        --------
+        Dict with the bootstrap triangles, reserve estimate and sampling details
         """
-        if len(self.iteration_details) <= iteration_num:
-            # Need to run more iterations
-            needed = iteration_num + 1 - len(self.iteration_details)
-            self.run_bootstrap(needed)
+        n_available = self._reserves.shape[0]
+        if iteration_num >= n_available:
+            self._resample(max(2 * n_available, iteration_num + 1))
+
+        n_done = self._n_processed
+        if iteration_num >= n_done:
+            self.process_iterations(iteration_num + 1 - n_done)
+
+        return self.get_iteration_detail(iteration_num)
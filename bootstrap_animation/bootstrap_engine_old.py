@@ -3,12 +3,48 @@ Bootstrap Engine for Shapland ODP Bootstrap Methodology
 Uses chainladder's BootstrapODPSample with additional tracking for animation
 """
 
+import copy
+
 import numpy as np
 import pandas as pd
 import chainladder as cl
 from chainladder import BootstrapODPSample
 from typing import Dict, List, Tuple, Optional
 
+# Percentiles reported in bootstrap summaries
+PERCENTILE_LEVELS = (5, 25, 50, 75, 95)
+
+
+def _chainladder_future_payments(cumulative: np.ndarray) -> np.ndarray:
+    """
+    Expected incremental payments of the unobserved cells under volume-weighted chain ladder.
+
+    Accepts a single (n_origin, n_dev) triangle or a stacked
+    (n_iterations, n_origin, n_dev) batch; float32 input stays float32. Only cells
+    with origin + dev < n_origin are treated as observed. The projection is developed
+    one column at a time and only its increments are written, so the full projected
+    triangle is never materialised; observed cells are zero in the result.
+    """
+    n_origin, n_dev = cumulative.shape[-2:]
+    origin_idx = np.arange(n_origin)
+    dtype = np.result_type(cumulative, np.float32)
+    payments = np.zeros(cumulative.shape, dtype=dtype)
+    current = np.array(cumulative[..., 0], dtype=dtype)
+
+    for k in range(n_dev - 1):
+        # Age-to-age factor from origins observed at both k and k + 1
+        observed = origin_idx + k + 1 < n_origin
+        numerator = np.asarray(cumulative[..., observed, k + 1].sum(axis=-1))
+        denominator = np.asarray(cumulative[..., observed, k].sum(axis=-1))
+        ldf = np.divide(numerator, denominator, out=np.ones_like(numerator), where=denominator > 0)
+
+        # Develop future cells and keep only the increment of the step
+        developed = current * ldf[..., None]
+        payments[..., k + 1] = np.where(observed, 0, developed - current)
+        current = np.where(observed, cumulative[..., k + 1], developed)
+
+    return payments
+
 
 class AnimatedBootstrapODP:
     """
@@ -28,7 +64,6 @@ class AnimatedBootstrapODP:
             Random seed for reproducibility
         """
         self.random_state = random_state
-        np.random.seed(random_state)
 
         # Load data
         if triangle_data is None:
@@ -66,18 +101,39 @@ class AnimatedBootstrapODP:
         self.actual_incremental = self.triangle.cum_to_incr()
         fitted_incremental = np.diff(fitted_cumulative, axis=1, prepend=0)
 
-        # Store as Triangle object for consistency
-        fitted_tri = self.triangle.copy()
+        # Store as Triangle object for consistency; a shallow copy is enough since
+        # .values is replaced rather than modified in place
+        fitted_tri = copy.copy(self.triangle)
         fitted_tri.values = fitted_incremental.reshape(1, 1, *fitted_incremental.shape)
         self.fitted_incremental = fitted_tri
 
         # Calculate Pearson residuals
         self._calculate_residuals()
 
+        # Arrays for vectorized residual sampling (float32: bootstrap triangles are
+        # for display and reserve sums, so half-width floats halve memory traffic)
+        fitted = self.fitted_incremental.values[0, 0]
+        origin_idx, dev_idx = np.indices(fitted.shape)
+        self._fitted_arr = fitted.astype(np.float32)
+        self._upper_mask = (origin_idx + dev_idx < n_origin) & (fitted > 0)
+
+        # Loop invariants of every iteration: sampled cells as (origin, dev) pairs,
+        # fitted upper-triangle values and their sqrt
+        self._upper_ij = np.argwhere(self._upper_mask).astype(np.int16)
+        self._fitted_upper = self._fitted_arr[self._upper_mask]
+        self._sqrt_fitted_upper = np.sqrt(self._fitted_upper)
+
+        # Invariants of the engine, cached for metadata requests
+        self.base_reserve = self._calculate_base_reserve()
+        self._origin_labels = list(self.triangle.origin.astype(str))
+        self._development_labels = list(self.triangle.development.astype(str))
+
         # Storage for bootstrap iterations
         self.bootstrap_samples = []
         self.reserve_estimates = []
         self.iteration_details = []
+        self._bootstrap_incremental = None
+        self._bootstrap_cumulative = None
 
     def _calculate_residuals(self):
         """Calculate unscaled and adjusted Pearson residuals."""
@@ -85,53 +141,79 @@ class AnimatedBootstrapODP:
         actual = self.actual_incremental.values[0, 0]  # Shape: (origin, dev)
         fitted = self.fitted_incremental.values[0, 0]
 
-        # Unscaled Pearson residuals: (actual - fitted) / sqrt(fitted)
-        with np.errstate(divide='ignore', invalid='ignore'):
-            self.unscaled_residuals = (actual - fitted) / np.sqrt(fitted)
-            self.unscaled_residuals = np.nan_to_num(self.unscaled_residuals, nan=0.0, posinf=0.0, neginf=0.0)
+        # Unscaled Pearson residuals: (actual - fitted) / sqrt(fitted), zero where undefined
+        defined = (fitted > 0) & np.isfinite(actual)
+        self.unscaled_residuals = np.zeros_like(fitted, dtype=np.float64)
+        np.divide(
+            actual - fitted,
+            np.sqrt(fitted, out=np.ones_like(fitted, dtype=np.float64), where=defined),
+            out=self.unscaled_residuals,
+            where=defined
+        )
 
         # Get non-zero residuals for sampling (exclude structural zeros in lower triangle)
-        self.residual_pool = []
-        n_origin = actual.shape[0]
-        n_dev = actual.shape[1]
-
-        for i in range(n_origin):
-            for j in range(n_dev):
-                # Only include values in upper triangle where we have actual data
-                # Exclude zero residuals as per Shapland (where actual == fitted)
-                if i + j < n_origin and fitted[i, j] > 0 and self.unscaled_residuals[i, j] != 0:
-                    self.residual_pool.append({
-                        'origin': i,
-                        'dev': j,
-                        'residual': self.unscaled_residuals[i, j],
-                        'fitted': fitted[i, j]
-                    })
+        # Only include values in upper triangle where we have actual data
+        # Exclude zero residuals as per Shapland (where actual == fitted)
+        n_origin, n_dev = actual.shape
+        origin_idx, dev_idx = np.indices(actual.shape)
+        pool_mask = (origin_idx + dev_idx < n_origin) & (fitted > 0) & (self.unscaled_residuals != 0)
+
+        # Residual pool stored as parallel arrays (struct-of-arrays)
+        pool_origin, pool_dev = np.nonzero(pool_mask)
+        self._pool_origin = pool_origin.astype(np.int16)
+        self._pool_dev = pool_dev.astype(np.int16)
+        self._pool_res = self.unscaled_residuals[pool_mask].astype(np.float64)
+        self._pool_fitted = fitted[pool_mask].astype(np.float64)
+        self._residual_pool_cache = None
 
         # Calculate adjustment factor for degrees of freedom
-        n = len(self.residual_pool)
+        n = self._pool_res.size
         p = n_dev - 1  # Number of development factors estimated
         self.df = max(n - p, 1)
 
         # Apply degrees of freedom adjustment to create adjusted residuals
         adjustment = np.sqrt(n / self.df)
-        for item in self.residual_pool:
-            item['adjusted_residual'] = item['residual'] * adjustment
+        self._pool_adj = np.multiply(self._pool_res, adjustment)
 
         # FIX 1: Center the adjusted residuals to ensure unbiased bootstrap
         # This is CRITICAL - the mean of sampled residuals must be zero
-        mean_adjusted = np.mean([item['adjusted_residual'] for item in self.residual_pool])
-        for item in self.residual_pool:
-            item['adjusted_residual'] -= mean_adjusted
+        self._pool_adj -= self._pool_adj.mean()
+        self._pool_adj = self._pool_adj.astype(np.float32)
 
         # Calculate scale parameter (phi) for process variance (optional - for Fix 2)
         # Per Shapland formula 3.17: phi = sum(Pearson_residual^2) / degrees_of_freedom
-        sum_squared_residuals = sum([item['residual']**2 for item in self.residual_pool])
-        self.scale_parameter = sum_squared_residuals / self.df
-
-    def run_single_iteration(self, iteration_num: int) -> Dict:
+        self.scale_parameter = np.sum(self._pool_res ** 2) / self.df
+
+    @property
+    def residual_pool(self) -> List[Dict]:
+        """Residual pool as a list of per-cell dicts, built on first access."""
+        if self._residual_pool_cache is None:
+            self._residual_pool_cache = [
+                {
+                    'origin': int(i),
+                    'dev': int(j),
+                    'residual': res,
+                    'fitted': fit,
+                    'adjusted_residual': adj
+                }
+                for i, j, res, fit, adj in zip(
+                    self._pool_origin, self._pool_dev, self._pool_res, self._pool_fitted, self._pool_adj
+                )
+            ]
+        return self._residual_pool_cache
+
+    def run_single_iteration(self, iteration_num: int, track_details: bool = False) -> Dict:
         """
         Run a single bootstrap iteration with detailed tracking.
 
+        Parameters:
+        -----------
+        iteration_num : int
+            Iteration index, used to seed the random generator
+        track_details : bool
+            Whether to build the per-cell sampling details used by the animation
+            and keep the result in iteration_details
+
         Returns:
         --------
         Dict containing:
@@ -139,78 +221,33 @@ class AnimatedBootstrapODP:
             - bootstrap_triangle: The generated bootstrap triangle
             - reserve_estimate: The estimated reserve for this iteration
         """
-        np.random.seed(self.random_state + iteration_num)
+        # Independent child stream per iteration (reproducible, no global RNG state)
+        rng = np.random.default_rng(np.random.SeedSequence([self.random_state, iteration_num]))
 
-        # Track sampling details
-        sampling_details = []
-
-        # Get array dimensions
-        n_origin = self.actual_incremental.values[0, 0].shape[0]
-        n_dev = self.actual_incremental.values[0, 0].shape[1]
-
-        # Create bootstrap incremental triangle
-        bootstrap_incremental = np.zeros((n_origin, n_dev))
-        fitted = self.fitted_incremental.values[0, 0]
+        # Sample all residuals for the HISTORICAL triangle in one draw
+        sampled_idx, bootstrap_values, bootstrap_incremental = self._sample_incremental(rng)
 
-        # Sample residuals and generate bootstrap values for HISTORICAL triangle only
-        for i in range(n_origin):
-            for j in range(n_dev):
-                if i + j < n_origin and fitted[i, j] > 0:
-                    # Sample a residual with replacement
-                    sampled = np.random.choice(len(self.residual_pool))
-                    sampled_residual = self.residual_pool[sampled]['adjusted_residual']
-
-                    # Generate bootstrap value: fitted + residual * sqrt(fitted)
-                    bootstrap_value = fitted[i, j] + sampled_residual * np.sqrt(fitted[i, j])
-                    bootstrap_value = max(0, bootstrap_value)  # Ensure non-negative
-
-                    bootstrap_incremental[i, j] = bootstrap_value
-
-                    # Track this sample
-                    sampling_details.append({
-                        'origin': i,
-                        'dev': j,
-                        'fitted': fitted[i, j],
-                        'sampled_residual': sampled_residual,
-                        'sampled_from_origin': self.residual_pool[sampled]['origin'],
-                        'sampled_from_dev': self.residual_pool[sampled]['dev'],
-                        'bootstrap_value': bootstrap_value,
-                        'sequence': len(sampling_details)
-                    })
-
-        # Convert to cumulative
+        # Track sampling details for the animation only when requested
+        sampling_details = []
+        if track_details:
+            fitted_upper = self._fitted_upper
+            sampled_residuals = self._pool_adj[sampled_idx]
+            for seq, ((i, j), k) in enumerate(zip(self._upper_ij.tolist(), sampled_idx.tolist())):
+                sampling_details.append({
+                    'origin': i,
+                    'dev': j,
+                    'fitted': fitted_upper[seq],
+                    'sampled_residual': sampled_residuals[seq],
+                    'sampled_from_origin': int(self._pool_origin[k]),
+                    'sampled_from_dev': int(self._pool_dev[k]),
+                    'bootstrap_value': bootstrap_values[seq],
+                    'sequence': seq
+                })
+
+        # Convert to cumulative and project future payments with chain ladder
         bootstrap_cumulative = np.cumsum(bootstrap_incremental, axis=1)
-
-        # Create chainladder Triangle object from bootstrap historical data
-        bootstrap_tri = self.triangle.copy()
-        bootstrap_tri.values = bootstrap_cumulative.reshape(1, 1, *bootstrap_cumulative.shape)
-
-        # Fit NEW chain ladder model to bootstrap triangle and project to ultimate
-        bootstrap_model = cl.Chainladder().fit(bootstrap_tri)
-
-        # FIX 2: Add process variance to future incremental payments
-        # Get full projection with future periods
-        full_projection = bootstrap_model.full_triangle_.values[0, 0]
-        full_incremental = np.diff(full_projection, axis=1, prepend=0)
-
-        # Calculate reserve by summing future payments with Gamma noise
-        reserve = 0.0
-        for i in range(n_origin):
-            latest_dev_idx = n_origin - i - 1  # Last observed diagonal position
-
-            # Sum future incremental payments with process variance
-            for j in range(latest_dev_idx + 1, full_projection.shape[1]):
-                if not np.isnan(full_incremental[i, j]) and full_incremental[i, j] > 0:
-                    expected_payment = full_incremental[i, j]
-
-                    # Add process variance via Gamma distribution
-                    # mean = expected_payment, variance = expected_payment * phi
-                    # Gamma params: shape = mean/phi, scale = phi
-                    shape = expected_payment / self.scale_parameter
-                    scale = self.scale_parameter
-                    actual_payment = np.random.gamma(shape, scale)
-
-                    reserve += actual_payment
+        future_payments = _chainladder_future_payments(bootstrap_cumulative)
+        reserve = self._simulate_reserve(future_payments, rng)
 
         result = {
             'iteration': iteration_num,
@@ -220,12 +257,71 @@ class AnimatedBootstrapODP:
             'reserve_estimate': reserve
         }
 
-        self.iteration_details.append(result)
+        # Only iterations shown in the animation are retained
+        if track_details:
+            self.iteration_details.append(result)
         self.reserve_estimates.append(reserve)
 
         return result
 
-    def run_bootstrap(self, n_iterations: int = 1000) -> Dict:
+    def _sample_incremental(self, rng: np.random.Generator, batch_shape: Tuple[int, ...] = ()):
+        """
+        Draw pool residuals for every sampled cell and build bootstrap incremental triangles.
+
+        Parameters:
+        -----------
+        rng : np.random.Generator
+            Random generator to draw the pool indices from
+        batch_shape : Tuple[int, ...]
+            Leading shape of the batch; () draws a single triangle
+
+        Returns:
+        --------
+        Tuple of sampled pool indices (batch_shape + (n_upper,)), bootstrap values of
+        the sampled cells (same shape) and incremental triangles
+        (batch_shape + (n_origin, n_dev))
+        """
+        sampled_idx = rng.integers(
+            0, self._pool_adj.size, size=(*batch_shape, self._fitted_upper.size), dtype=np.int32
+        )
+        bootstrap_values = self._pool_adj[sampled_idx]
+
+        # fitted + residual * sqrt(fitted), kept non-negative, computed in place
+        np.multiply(bootstrap_values, self._sqrt_fitted_upper, out=bootstrap_values)
+        np.add(bootstrap_values, self._fitted_upper, out=bootstrap_values)
+        np.maximum(bootstrap_values, 0, out=bootstrap_values)
+
+        bootstrap_incremental = np.zeros((*batch_shape, *self._fitted_arr.shape), dtype=np.float32)
+        bootstrap_incremental[..., self._upper_mask] = bootstrap_values
+
+        return sampled_idx, bootstrap_values, bootstrap_incremental
+
+    def _simulate_reserve(self, future_payments: np.ndarray, rng: np.random.Generator):
+        """
+        Sum the future payments of projected triangles with Gamma process variance.
+
+        Accepts the expected future payments of a single (n_origin, n_dev) triangle,
+        returning a float, or of a stacked (n_iterations, n_origin, n_dev) batch,
+        returning one reserve per iteration.
+        """
+        # FIX 2: Add process variance to future incremental payments
+        # Only positive expected payments are simulated (NaN compares False)
+        positive = future_payments > 0
+        expected_payment = future_payments[positive]
+
+        # Add process variance via Gamma distribution, one draw for all cells
+        # mean = expected_payment, variance = expected_payment * phi
+        # Gamma params: shape = mean/phi, scale = phi
+        actual_payment = rng.gamma(expected_payment / self.scale_parameter, self.scale_parameter)
+
+        if future_payments.ndim == 2:
+            return float(actual_payment.sum())
+
+        # Sum the draws back per iteration
+        iteration_idx = np.nonzero(positive.reshape(positive.shape[0], -1))[0]
+        return np.bincount(iteration_idx, weights=actual_payment, minlength=positive.shape[0])
+
+    def run_bootstrap(self, n_iterations: int = 1000, return_details: bool = False) -> Dict:
         """
         Run complete bootstrap simulation.
 
@@ -233,32 +329,74 @@ class AnimatedBootstrapODP:
         -----------
         n_iterations : int
             Number of bootstrap iterations to run
+        return_details : bool
+            Whether to keep the bootstrap triangles (see get_iteration) and include
+            'iteration_details' in the result
 
         Returns:
         --------
-        Dict containing summary statistics and all iteration details
+        Dict containing summary statistics, plus 'iteration_details' if requested
         """
         self.iteration_details = []
-        self.reserve_estimates = []
 
-        for i in range(n_iterations):
-            self.run_single_iteration(i)
+        rng = np.random.default_rng(self.random_state)
 
-        reserves = np.array(self.reserve_estimates)
+        # Sample residuals for every iteration at once into a (n_iterations, n_origin, n_dev) tensor
+        _, _, bootstrap_incremental = self._sample_incremental(rng, (n_iterations,))
+        bootstrap_cumulative = np.cumsum(bootstrap_incremental, axis=2)
 
-        return {
+        # Re-estimate chain ladder for every bootstrap triangle in one batched pass
+        future_payments = _chainladder_future_payments(bootstrap_cumulative)
+
+        # Process variance for all iterations in a single Gamma draw
+        reserves = self._simulate_reserve(future_payments, rng)
+
+        # Bulk runs keep only the reserves unless details are requested
+        self.reserve_estimates = reserves.tolist()
+        if return_details:
+            self._bootstrap_incremental = bootstrap_incremental
+            self._bootstrap_cumulative = bootstrap_cumulative
+        else:
+            self._bootstrap_incremental = None
+            self._bootstrap_cumulative = None
+
+        # All summary percentiles from a single partition pass
+        percentiles = np.percentile(reserves, PERCENTILE_LEVELS)
+
+        summary = {
             'n_iterations': n_iterations,
             'reserve_estimates': reserves,
             'mean': np.mean(reserves),
             'std': np.std(reserves),
-            'percentiles': {
-                '5': np.percentile(reserves, 5),
-                '25': np.percentile(reserves, 25),
-                '50': np.percentile(reserves, 50),
-                '75': np.percentile(reserves, 75),
-                '95': np.percentile(reserves, 95)
-            },
-            'iteration_details': self.iteration_details
+            'percentiles': dict(zip(map(str, PERCENTILE_LEVELS), percentiles))
+        }
+        if return_details:
+            summary['iteration_details'] = [self.get_iteration(i) for i in range(n_iterations)]
+
+        return summary
+
+    def get_iteration(self, iteration_num: int) -> Dict:
+        """
+        Get the details of one iteration of the last run_bootstrap(return_details=True).
+
+        Parameters:
+        -----------
+        iteration_num : int
+            Iteration index
+
+        Returns:
+        --------
+        Dict with the bootstrap triangles and reserve estimate of the iteration
+        """
+        if self._bootstrap_incremental is None:
+            raise ValueError("Iteration details were not kept; run run_bootstrap with return_details=True")
+
+        return {
+            'iteration': iteration_num,
+            'sampling_details': [],
+            'bootstrap_incremental': self._bootstrap_incremental[iteration_num],
+            'bootstrap_cumulative': self._bootstrap_cumulative[iteration_num],
+            'reserve_estimate': self.reserve_estimates[iteration_num]
         }
 
     def get_triangle_metadata(self) -> Dict:
@@ -269,13 +407,13 @@ class AnimatedBootstrapODP:
         return {
             'n_origin': n_origin,
             'n_dev': n_dev,
-            'origin_labels': list(self.triangle.origin.astype(str)),
-            'development_labels': list(self.triangle.development.astype(str)),
+            'origin_labels': self._origin_labels,
+            'development_labels': self._development_labels,
             'actual_incremental': self.actual_incremental.values[0, 0],
             'fitted_incremental': self.fitted_incremental.values[0, 0],
             'residuals': self.unscaled_residuals,
             'residual_pool': self.residual_pool,
-            'base_reserve': self._calculate_base_reserve()
+            'base_reserve': self.base_reserve
         }
 
     def _calculate_base_reserve(self) -> float:
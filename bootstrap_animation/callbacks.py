@@ -3,14 +3,73 @@ Callback functions for Dash application
 Handles interactivity and state management
 """
 
-from dash import Input, Output, State, ctx
+import bisect
+import functools
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from dash import Input, Output, Patch, State, ctx, html, no_update
 from dash.exceptions import PreventUpdate
-import plotly.graph_objects as go
-from typing import Dict, Optional
-import time
+import dash_bootstrap_components as dbc
+import plotly.io as pio
+from typing import Dict, Optional, Tuple
+
+# Dash serialises callback outputs through plotly.io.json; require the orjson engine
+# rather than letting "auto" silently fall back to the standard library encoder
+pio.json.config.default_engine = 'orjson'
+
+
+# Iterations projected per interval tick while "Run All" streams results
+RUN_ALL_BATCH_SIZE = 25
+
+# Iterations projected (with animation details) each time playback runs ahead of them
+PLAY_BATCH_SIZE = 25
+
+# Animation figures kept per memoised figure builder
+FIGURE_CACHE_SIZE = 512
+
+# Relative change in reserve mean and std below which fast-forward playback
+# skips redrawing the distribution and statistics figures
+STATS_REDRAW_TOLERANCE = 1e-3
+
+# Playback interval (ms per frame) at 1x speed, and the minimum interval by speed:
+# speeds below the first threshold get the first minimum, and so on. Minimums
+# account for the cost of creating multiple Plotly figures (25 down to 10 fps max).
+BASE_INTERVAL = 300
+SPEED_THRESHOLDS = (2, 3, 5, 7)
+MIN_INTERVALS = (40, 50, 60, 80, 100)
+
+
+def min_interval_for_speed(speed: float) -> int:
+    """Minimum playback interval in milliseconds for a speed-slider value."""
+    return MIN_INTERVALS[bisect.bisect_right(SPEED_THRESHOLDS, speed)]
 
 
-def register_callbacks(app, bootstrap_engine, visualizer):
+@functools.lru_cache(maxsize=128)
+def compute_interval(speed: float, base: int = BASE_INTERVAL) -> int:
+    """Playback interval in milliseconds for a speed-slider value, as set in the browser."""
+    return max(min_interval_for_speed(speed), int(base / speed))
+
+
+# compute_interval for the browser, generated from the same table
+UPDATE_INTERVAL_SPEED_JS = """
+function update_interval_speed(speed_value) {
+    const thresholds = %s;
+    const min_intervals = %s;
+    const interval = Math.trunc(%s / speed_value);
+
+    // Index of the minimum: how many thresholds the speed has reached
+    let i = 0;
+    while (i < thresholds.length && speed_value >= thresholds[i]) {
+        i++;
+    }
+    return Math.max(min_intervals[i], interval);
+}
+""" % (json.dumps(SPEED_THRESHOLDS), json.dumps(MIN_INTERVALS), json.dumps(BASE_INTERVAL))
+
+
+def register_callbacks(app, get_engine, get_visualizer):
     """
     Register all callbacks for the Dash application.
 
@@ -18,133 +77,542 @@ def register_callbacks(app, bootstrap_engine, visualizer):
     -----------
     app : dash.Dash
         The Dash application instance
-    bootstrap_engine : AnimatedBootstrapODP
-        The bootstrap engine instance
-    visualizer : BootstrapVisualizer
-        The visualizer instance
+    get_engine : Callable[[str], AnimatedBootstrapODP]
+        Returns the (cached) bootstrap engine for a dataset dropdown value
+    get_visualizer : Callable[[str], BootstrapVisualizer]
+        Returns the (cached) visualizer for a dataset dropdown value
     """
 
+    # Animation figures memoised on their logical frame. They are cached as plain
+    # dicts, which Dash serialises as-is, and cleared whenever a new run starts.
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def sampling_context(dataset_name: str, iteration: int) -> Dict:
+        iteration_detail = get_engine(dataset_name).get_iteration_detail(iteration)
+        return get_visualizer(dataset_name).prepare_iteration(iteration_detail)
+
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def sampling_frame_figure(dataset_name: str, iteration: int, frame: int) -> Dict:
+        iteration_detail = get_engine(dataset_name).get_iteration_detail(iteration)
+        return get_visualizer(dataset_name).create_sampling_animation_frame(
+            iteration_detail, frame, fast=True, prepared=sampling_context(dataset_name, iteration)
+        )
+
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def bootstrap_triangle_figure(dataset_name: str, iteration: int) -> Dict:
+        iteration_detail = get_engine(dataset_name).get_iteration_detail(iteration)
+        return get_visualizer(dataset_name).create_triangle_heatmap(
+            iteration_detail['bootstrap_incremental'],
+            f"Bootstrap Triangle - Iteration {iteration + 1}",
+            colorscale='Purples',
+            value_divisor=1000,
+            colorbar_title="$000s",
+            hover_suffix=" ($000s)",
+            fast=True
+        )
+
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def distribution_figure(dataset_name: str, iteration: int) -> Dict:
+        bootstrap_engine = get_engine(dataset_name)
+        return get_visualizer(dataset_name).create_reserve_distribution(
+            bootstrap_engine.reserve_estimates[:iteration + 1],
+            current_estimate=bootstrap_engine.reserve_estimates[iteration],
+            base_reserve=bootstrap_engine.base_reserve,
+            fast=True
+        )
+
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def statistics_figure(dataset_name: str, iteration: int) -> Dict:
+        return get_visualizer(dataset_name).create_statistics_panel(
+            {'reserve_estimates': get_engine(dataset_name).reserve_estimates[:iteration + 1]},
+            iteration,
+            fast=True
+        )
+
+    # The residual pool is fixed per dataset, so its figures survive new runs
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def residual_pool_figure(dataset_name: str, highlighted_idx: Optional[int] = None) -> Dict:
+        return get_visualizer(dataset_name).create_residual_pool_scatter(
+            get_engine(dataset_name).residual_pool,
+            highlighted_idx=highlighted_idx,
+            fast=True
+        )
+
+    @functools.lru_cache(maxsize=16)
+    def dataset_figures(dataset_name: str):
+        """Fitted, residual and actual heatmaps of a dataset (fixed per dataset, so built once)."""
+        metadata = get_engine(dataset_name).get_triangle_metadata()
+        visualizer = get_visualizer(dataset_name)
+
+        # Fitted triangle (expected values from model)
+        fitted_fig = visualizer.create_triangle_heatmap(
+            metadata['fitted_incremental'],
+            "Fitted Incremental Triangle (Model Expected Values)",
+            colorscale='Blues',
+            value_divisor=1000,
+            colorbar_title="$000s",
+            hover_suffix=" ($000s)",
+            fast=True
+        )
+
+        # Residual triangle
+        residual_fig = visualizer.create_triangle_heatmap(
+            metadata['residuals'],
+            "Pearson Residuals",
+            colorscale='RdBu',
+            text_format="{:,.2f}",
+            hover_format="{:,.2f}",
+            colorbar_title="Residual",
+            fast=True
+        )
+
+        # Actual triangle in both display modes (toggled in the browser)
+        actual_figs = {
+            mode: visualizer.create_triangle_heatmap(
+                metadata[f'actual_{mode}'],
+                f"Actual Loss Triangle ({mode.capitalize()})",
+                colorscale='Greens',
+                value_divisor=1000,
+                colorbar_title="$000s",
+                hover_suffix=" ($000s)",
+                fast=True
+            )
+            for mode in ('cumulative', 'incremental')
+        }
+
+        return fitted_fig, residual_fig, actual_figs
+
+    @functools.lru_cache(maxsize=16)
+    def dev_factor_table(dataset_name: str) -> dbc.Table:
+        """Incremental and cumulative development factor table (fixed per dataset, so built once)."""
+        bootstrap_engine = get_engine(dataset_name)
+        model = bootstrap_engine.base_model
+        ldf = model.ldf_.values[0, 0, 0, :]
+        cdf = model.cdf_.values[0, 0, 0, :]
+
+        # Get development period labels
+        n_dev = len(ldf)
+        dev_periods = bootstrap_engine.triangle.development.values
+
+        # Create headers for development period pairs
+        headers = []
+        for i in range(n_dev):
+            if i < len(dev_periods) - 1:
+                headers.append(f"{dev_periods[i]}-{dev_periods[i+1]}")
+
+        # Build table with both incremental and cumulative LDFs
+        table_header = [
+            html.Thead(html.Tr([html.Th("Factor Type")] + [html.Th(h, style={'textAlign': 'center'}) for h in headers]))
+        ]
+
+        # Incremental LDF row
+        incr_cells = [html.Td("Incremental LDF", style={'fontWeight': 'bold'})]
+        for i in range(len(headers)):
+            incr_cells.append(html.Td(f"{ldf[i]:.4f}", style={'textAlign': 'center'}))
+
+        # Cumulative LDF row
+        cum_cells = [html.Td("Cumulative LDF", style={'fontWeight': 'bold'})]
+        for i in range(len(headers)):
+            cum_cells.append(html.Td(f"{cdf[i]:.4f}", style={'textAlign': 'center'}))
+
+        table_body = [html.Tbody([
+            html.Tr(incr_cells),
+            html.Tr(cum_cells)
+        ])]
+
+        return dbc.Table(table_header + table_body, bordered=True, hover=True, striped=True, size='sm')
+
+    @functools.lru_cache(maxsize=16)
+    def empty_figures(dataset_name: str):
+        """Main, residual, distribution and statistics figures before a run (fixed per dataset)."""
+        bootstrap_engine = get_engine(dataset_name)
+        visualizer = get_visualizer(dataset_name)
+
+        empty_triangle = visualizer.create_triangle_heatmap(
+            bootstrap_engine.get_triangle_metadata()['actual_incremental'],
+            "Bootstrap Triangle - Ready to start",
+            colorscale='Purples',
+            value_divisor=1000,
+            colorbar_title="$000s",
+            fast=True
+        )
+        empty_dist = visualizer.create_reserve_distribution(
+            [],
+            base_reserve=bootstrap_engine.base_reserve,
+            fast=True
+        )
+        empty_stats = visualizer.create_statistics_panel(
+            {'reserve_estimates': []},
+            0,
+            fast=True
+        )
+        return empty_triangle, residual_pool_figure(dataset_name), empty_dist, empty_stats
+
+    def sampling_frame_patch(dataset_name: str, iteration: int, frame: int, shown_frame: int) -> Patch:
+        """Changes from the sampling frame on screen to another frame of the same iteration."""
+        patch = Patch()
+        if frame == shown_frame + 1:
+            # Next frame: fill in one cell and move the outline and labels to it
+            payload = sampling_payload(dataset_name, iteration)
+            origin, dev = payload['cells'][frame]
+            patch['data'][0]['z'][origin][dev] = payload['values'][frame]
+            if payload['values'][frame] is not None:
+                patch['data'][0]['text'][origin][dev] = payload['texts'][frame]
+            patch['layout']['shapes'][0].update(x0=dev - 0.5, x1=dev + 0.5, y0=origin - 0.5, y1=origin + 0.5)
+            patch['layout']['annotations'][0]['text'] = payload['annotations'][frame]
+            patch['layout']['title']['text'] = f"Sampling Progress: {frame + 1} / {len(payload['cells'])}"
+            return patch
+
+        frame_fig = sampling_frame_figure(dataset_name, iteration, frame)
+        for key in ('z', 'text'):
+            patch['data'][0][key] = frame_fig['data'][0][key]
+        for key in ('shapes', 'annotations', 'title'):
+            patch['layout'][key] = frame_fig['layout'][key]
+        return patch
+
+    def residual_highlight_patch(
+        dataset_name: str, shown_idx: Optional[int], highlighted_idx: Optional[int]
+    ) -> Patch:
+        """Move the residual pool highlight from shown_idx to highlighted_idx."""
+        patch = Patch()
+        if shown_idx == highlighted_idx:
+            return patch
+        # Only the highlight trace (drawn over the pool) changes
+        highlight = residual_pool_figure(dataset_name, highlighted_idx)['data'][1]
+        for key in ('x', 'y', 'text'):
+            patch['data'][1][key] = highlight[key]
+        return patch
+
+    def ensure_recorded(bootstrap_engine, iteration: int) -> None:
+        """Project further iterations (with details) until iteration is available."""
+        missing = iteration + 1 - bootstrap_engine.n_processed
+        if missing > 0:
+            bootstrap_engine.process_iterations(max(missing, PLAY_BATCH_SIZE))
+
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def residual_highlights(dataset_name: str, iteration: int) -> Tuple[Optional[int], ...]:
+        """Residual pool index each sampled cell of an iteration was drawn from, in frame order."""
+        sampling_arrays = get_engine(dataset_name).get_iteration_detail(iteration)['sampling_arrays']
+        return tuple(
+            residual_idx if residual_idx >= 0 else None
+            for residual_idx in sampling_arrays['sampled_residual_index'].tolist()
+        )
+
+    @functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+    def sampling_payload(dataset_name: str, iteration: int) -> Dict:
+        """Everything the browser needs to animate one iteration's cells by itself."""
+        bootstrap_engine = get_engine(dataset_name)
+        iteration_detail = bootstrap_engine.get_iteration_detail(iteration)
+
+        payload = get_visualizer(dataset_name).create_sampling_payload(iteration_detail)
+        payload['iteration'] = iteration
+        payload['highlights'] = list(residual_highlights(dataset_name, iteration))
+        payload['residual_figure'] = residual_pool_figure(dataset_name)
+        return payload
+
+    # Figures of the next iteration are built on one background thread while
+    # the current one is on screen
+    prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix='figure-prefetch')
+    prefetches: Dict[tuple, Future] = {}
+    prefetches_lock = threading.Lock()  # prefetches is shared by all request threads
+
+    def build_iteration_figures(dataset_name: str, iteration: int, animate_cells: bool, with_summary: bool) -> None:
+        if animate_cells:
+            sampling_payload(dataset_name, iteration)
+            sampling_frame_figure(dataset_name, iteration, 0)
+        else:
+            bootstrap_triangle_figure(dataset_name, iteration)
+        if with_summary:
+            distribution_figure(dataset_name, iteration)
+            statistics_figure(dataset_name, iteration)
+
+    def prefetch_iteration(dataset_name: str, iteration: int, animate_cells: bool, with_summary: bool) -> None:
+        """Warm the memoised figures of an already recorded iteration in the background."""
+        if iteration >= get_engine(dataset_name).n_processed:
+            return
+        with prefetches_lock:
+            for key in [key for key, future in prefetches.items() if future.done()]:
+                prefetches.pop(key, None)
+            key = (dataset_name, iteration)
+            if key not in prefetches:
+                prefetches[key] = prefetcher.submit(
+                    build_iteration_figures, dataset_name, iteration, animate_cells, with_summary
+                )
+
+    def await_prefetch(dataset_name: str, iteration: int) -> None:
+        """Wait for a pending prefetch of this iteration instead of building its figures twice."""
+        with prefetches_lock:
+            future = prefetches.pop((dataset_name, iteration), None)
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                pass  # anything missing is built on demand
+
+    def clear_figure_caches() -> None:
+        """Drop memoised figures of the previous run."""
+        # Let an in-flight prefetch finish so it cannot refill the cleared caches
+        with prefetches_lock:
+            pending = [future for future in prefetches.values() if not future.cancel()]
+            prefetches.clear()
+        wait(pending)
+
+        for cached in (
+            sampling_context, sampling_frame_figure, bootstrap_triangle_figure, distribution_figure,
+            statistics_figure, sampling_payload, residual_highlights
+        ):
+            cached.cache_clear()
+
     @app.callback(
         [
             Output('iteration-store', 'data'),
             Output('play-button', 'children'),
             Output('play-button', 'color'),
+            Output('cell-frame-store', 'data', allow_duplicate=True),
         ],
         [
-            Input('play-button', 'n_clicks'),
             Input('reset-button', 'n_clicks'),
             Input('run-all-button', 'n_clicks'),
         ],
         [
             State('iteration-store', 'data'),
             State('n-iterations-slider', 'value'),
+            State('dataset-dropdown', 'value'),
         ],
         prevent_initial_call=True
     )
-    def control_playback(play_clicks, reset_clicks, run_all_clicks, store_data, n_iterations):
-        """Handle play/pause/reset button clicks."""
+    def control_playback(reset_clicks, run_all_clicks, store_data, n_iterations, dataset_name):
+        """Handle reset and run-all button clicks."""
+        bootstrap_engine = get_engine(dataset_name)
+
         if store_data is None:
             store_data = {
                 'is_playing': False,
                 'current_iteration': 0,
                 'current_frame': 0,
                 'n_iterations': n_iterations,
-                'bootstrap_complete': False
+                'bootstrap_complete': False,
+                'run_all': False
             }
 
         triggered_id = ctx.triggered_id
 
         if triggered_id == 'reset-button':
             # Reset everything - clear bootstrap engine data
-            bootstrap_engine.iteration_details = []
-            bootstrap_engine.reserve_estimates = []
+            # Caches first: clearing waits for any prefetch still reading the engine
+            clear_figure_caches()
+            bootstrap_engine.reset_results()
             return {
                 'is_playing': False,
                 'current_iteration': 0,
                 'current_frame': 0,
                 'n_iterations': n_iterations,
-                'bootstrap_complete': False
-            }, 'Play', 'success'
+                'bootstrap_complete': False,
+                'run_all': False
+            }, 'Play', 'success', None
 
         elif triggered_id == 'run-all-button':
-            # Run all iterations without animation
-            if len(bootstrap_engine.iteration_details) < n_iterations:
-                bootstrap_engine.run_bootstrap(n_iterations)
+            # Run all iterations without animation, streamed in batches by the interval
+            clear_figure_caches()
+            bootstrap_engine.prepare_bootstrap(n_iterations)
 
             return {
-                'is_playing': False,
-                'current_iteration': n_iterations - 1,
+                'is_playing': True,
+                'current_iteration': 0,
                 'current_frame': 0,
                 'n_iterations': n_iterations,
-                'bootstrap_complete': True
-            }, 'Play', 'success'
+                'bootstrap_complete': False,
+                'run_all': True
+            }, 'Pause', 'warning', None
 
-        elif triggered_id == 'play-button':
-            # Toggle play/pause
-            new_is_playing = not store_data.get('is_playing', False)
+        raise PreventUpdate
 
-            if new_is_playing and not store_data.get('bootstrap_complete', False):
-                # Start playing - run bootstrap if not already done
-                if len(bootstrap_engine.iteration_details) < n_iterations:
-                    # Run all bootstrap iterations (computation happens here)
-                    bootstrap_engine.run_bootstrap(n_iterations)
-                    store_data['bootstrap_complete'] = True
+    # Play/pause is toggled in the browser; only the first Play of a run goes to the
+    # server (via play-request-store), since the bootstrap has to be resampled first
+    app.clientside_callback(
+        """
+        function toggle_play(play_clicks, store_data, n_iterations) {
+            const no_update = window.dash_clientside.no_update;
+            store_data = store_data || {
+                is_playing: false,
+                current_iteration: 0,
+                current_frame: 0,
+                n_iterations: n_iterations,
+                bootstrap_complete: false,
+                run_all: false
+            };
+            const is_playing = !store_data.is_playing;
+
+            if (is_playing && !store_data.bootstrap_complete && !store_data.run_all) {
+                return [no_update, {n_iterations: n_iterations, n_clicks: play_clicks}];
+            }
+            return [Object.assign({}, store_data, {is_playing: is_playing, n_iterations: n_iterations}), no_update];
+        }
+        """,
+        [
+            Output('iteration-store', 'data', allow_duplicate=True),
+            Output('play-request-store', 'data'),
+        ],
+        [Input('play-button', 'n_clicks')],
+        [
+            State('iteration-store', 'data'),
+            State('n-iterations-slider', 'value'),
+        ],
+        prevent_initial_call=True
+    )
 
-            store_data['is_playing'] = new_is_playing
-            store_data['n_iterations'] = n_iterations
+    @app.callback(
+        [
+            Output('iteration-store', 'data', allow_duplicate=True),
+            Output('cell-frame-store', 'data', allow_duplicate=True),
+        ],
+        [Input('play-request-store', 'data')],
+        [
+            State('iteration-store', 'data'),
+            State('dataset-dropdown', 'value'),
+        ],
+        prevent_initial_call=True
+    )
+    def start_playback(play_request, store_data, dataset_name):
+        """Prepare the bootstrap on the first Play of a run and start playing."""
+        if not play_request:
+            raise PreventUpdate
 
-            button_text = 'Pause' if new_is_playing else 'Play'
-            button_color = 'warning' if new_is_playing else 'success'
+        bootstrap_engine = get_engine(dataset_name)
+        n_iterations = play_request['n_iterations']
+        cell_frame = no_update
 
-            return store_data, button_text, button_color
+        if bootstrap_engine.n_processed < n_iterations:
+            # Resample now; iterations are projected in batches as playback reaches them
+            clear_figure_caches()
+            bootstrap_engine.prepare_bootstrap(n_iterations)
+            bootstrap_engine.process_iterations(PLAY_BATCH_SIZE)
+            store_data['bootstrap_complete'] = True
+            cell_frame = None
 
-        raise PreventUpdate
+        store_data['is_playing'] = True
+        store_data['n_iterations'] = n_iterations
 
-    @app.callback(
-        Output('interval-component', 'disabled'),
-        [Input('iteration-store', 'data')]
+        return store_data, cell_frame
+
+    # Keep the play button in sync with the play state, including when a
+    # streamed "Run All" finishes on its own
+    app.clientside_callback(
+        """
+        function sync_play_button(store_data) {
+            const is_playing = Boolean(store_data && store_data.is_playing);
+            return [is_playing ? 'Pause' : 'Play', is_playing ? 'warning' : 'success'];
+        }
+        """,
+        [
+            Output('play-button', 'children', allow_duplicate=True),
+            Output('play-button', 'color', allow_duplicate=True),
+        ],
+        [Input('iteration-store', 'data')],
+        prevent_initial_call=True
     )
-    def control_interval(store_data):
-        """Enable/disable interval component based on play state."""
-        if store_data is None:
-            return True
-        return not store_data.get('is_playing', False)
 
-    @app.callback(
-        Output('interval-component', 'interval'),
-        [Input('speed-slider', 'value')]
+    # Enable/disable interval component based on play state and tab visibility (client-side).
+    # Ticks before the bootstrap is ready would only be rejected by update_visualization,
+    # except while "Run All" streams its batches.
+    app.clientside_callback(
+        """
+        function control_interval(store_data, tab_visible) {
+            if (!store_data || tab_visible === false) {
+                return true;
+            }
+            const ready = store_data.bootstrap_complete || store_data.run_all;
+            return !(store_data.is_playing && ready);
+        }
+        """,
+        Output('interval-component', 'disabled'),
+        [
+            Input('iteration-store', 'data'),
+            Input('tab-visible', 'data'),
+        ]
     )
-    def update_interval_speed(speed_value):
+
+    # Track tab visibility in the browser so hidden tabs stop ticking
+    app.clientside_callback(
         """
-        Update animation speed based on slider.
-        Speed slider: 0.1x to 10x
-        Interval: milliseconds per frame
-
-        At high speeds, we need much higher minimum intervals because:
-        - Creating 4 Plotly figures per update is expensive
-        - Dash state management adds overhead
-        - Browser needs time to render and respond
+        function watch_tab_visibility(store_id) {
+            if (!window._bootstrapVisibilityListener) {
+                window._bootstrapVisibilityListener = () => {
+                    window.dash_clientside.set_props(store_id, {data: !document.hidden});
+                };
+                document.addEventListener('visibilitychange', window._bootstrapVisibilityListener);
+            }
+            return !document.hidden;
+        }
+        """,
+        Output('tab-visible', 'data'),
+        [Input('tab-visible', 'id')]
+    )
+
+    # Set the interval, backing it off when the browser cannot keep up with it.
+    # Keeps the last 10 tick timestamps; if the median gap exceeds 1.5x the
+    # configured interval, the interval is raised to that median. Once ticks keep
+    # up again it steps halfway back to the speed slider's interval, and it returns
+    # to that interval whenever the speed changes or playback is paused or resumed.
+    app.clientside_callback(
         """
-        # Base interval: 300ms per frame at 1x speed (increased from 200ms)
-        base_interval = 300
-
-        # Calculate interval based on speed
-        interval = int(base_interval / speed_value)
-
-        # Set aggressive minimums to prevent overwhelming the browser
-        # These minimums account for the cost of creating multiple Plotly figures
-        if speed_value >= 7:
-            min_interval = 100  # At 7-10x, minimum 100ms (10 fps max)
-        elif speed_value >= 5:
-            min_interval = 80   # At 5-7x, minimum 80ms (12.5 fps max)
-        elif speed_value >= 3:
-            min_interval = 60   # At 3-5x, minimum 60ms (16.7 fps max)
-        elif speed_value >= 2:
-            min_interval = 50   # At 2-3x, minimum 50ms (20 fps max)
-        else:
-            min_interval = 40   # Below 2x, minimum 40ms (25 fps max)
+        function throttle_interval(n_intervals, disabled, target, interval) {
+            const no_update = window.dash_clientside.no_update;
+            const triggered = window.dash_clientside.callback_context.triggered_id;
+            const to_target = (target && interval !== target) ? target : no_update;
+
+            // Start a fresh window at the slider's interval on a speed change, pause or resume
+            if (triggered !== 'interval-component' || disabled) {
+                window._bootstrapTickTimes = [];
+                return to_target;
+            }
 
-        return max(min_interval, interval)
+            const times = window._bootstrapTickTimes || [];
+            times.push(performance.now());
+            if (times.length > 10) {
+                times.shift();
+            }
+            window._bootstrapTickTimes = times;
+            if (times.length < 10) {
+                return no_update;
+            }
+
+            const gaps = times.slice(1).map((t, i) => t - times[i]).sort((a, b) => a - b);
+            const median = gaps[Math.floor(gaps.length / 2)];
+            if (median > interval * 1.5) {
+                window._bootstrapTickTimes = [];
+                return Math.round(median);
+            }
+            if (target && interval > target) {
+                // Keeping up again: try halfway back towards the slider's interval
+                window._bootstrapTickTimes = [];
+                return Math.max(target, Math.round((interval + target) / 2));
+            }
+            return no_update;
+        }
+        """,
+        Output('interval-component', 'interval'),
+        [
+            Input('interval-component', 'n_intervals'),
+            Input('interval-component', 'disabled'),
+            Input('speed-interval-store', 'data'),
+        ],
+        [State('interval-component', 'interval')]
+    )
+
+    # Update animation speed based on slider (runs in the browser, no round-trip).
+    # Speed slider: 0.1x to 10x; interval: milliseconds per frame.
+    #
+    # At high speeds, we need much higher minimum intervals because:
+    # - Creating 4 Plotly figures per update is expensive
+    # - Dash state management adds overhead
+    # - Browser needs time to render and respond
+    # The JavaScript is generated from BASE_INTERVAL and the speed table above.
+    # throttle_interval applies it to the interval.
+    app.clientside_callback(
+        UPDATE_INTERVAL_SPEED_JS,
+        Output('speed-interval-store', 'data'),
+        [Input('speed-slider', 'value')]
+    )
 
     @app.callback(
         [
@@ -155,51 +623,94 @@ def register_callbacks(app, bootstrap_engine, visualizer):
             Output('statistics-graph', 'figure'),
             Output('progress-text', 'children'),
             Output('stats-text', 'children'),
+            Output('animation-payload-store', 'data'),
+            Output('cell-frame-store', 'data', allow_duplicate=True),
         ],
         [
-            Input('interval-component', 'n_intervals'),
+            Input('server-tick-store', 'data'),
             Input('step-button', 'n_clicks'),
             Input('iteration-store', 'data'),
+            Input('show-cell-animation', 'value'),
         ],
         [
-            State('show-cell-animation', 'value'),
+            State('dataset-dropdown', 'value'),
+            State('cell-frame-store', 'data'),
         ],
         prevent_initial_call=True
     )
-    def update_visualization(n_intervals, step_clicks, store_data, show_cell_anim):
+    def update_visualization(server_tick, step_clicks, store_data, show_cell_anim, dataset_name, cell_frame):
         """Update all visualizations based on current state."""
         if store_data is None:
             raise PreventUpdate
 
-        # Get state
-        current_iteration = store_data.get('current_iteration', 0)
-        current_frame = store_data.get('current_frame', 0)
-        n_iterations = store_data.get('n_iterations', 0)
-        is_playing = store_data.get('is_playing', False)
-        bootstrap_complete = store_data.get('bootstrap_complete', False)
+        # The store is only sent back when its contents change
+        incoming_store = dict(store_data)
+
+        bootstrap_engine = get_engine(dataset_name)
+        visualizer = get_visualizer(dataset_name)
+
+        # Every writer of iteration-store sets all of its keys, so they are read directly
+        current_iteration, current_frame, n_iterations, is_playing, bootstrap_complete = (
+            store_data[key] for key in (
+                'current_iteration', 'current_frame', 'n_iterations', 'is_playing', 'bootstrap_complete'
+            )
+        )
+
+        # A tick that lands after playback was paused has nothing to advance
+        if ctx.triggered_id == 'server-tick-store' and not is_playing:
+            raise PreventUpdate
+
+        # Run All: project the next batch of iterations per tick, updating only the summary
+        if store_data['run_all'] and not bootstrap_complete:
+            if not is_playing:
+                raise PreventUpdate
+
+            # Only reserves are kept; the iteration finally shown is detailed on demand
+            n_done = bootstrap_engine.process_iterations(RUN_ALL_BATCH_SIZE, record_details=False)
+
+            if n_done < n_iterations:
+                reserves_so_far = bootstrap_engine.reserve_estimates
+                store_data['current_iteration'] = n_done - 1
+
+                dist_fig = visualizer.create_reserve_distribution(
+                    reserves_so_far,
+                    base_reserve=bootstrap_engine.base_reserve
+                )
+                stats_fig = visualizer.create_statistics_panel(
+                    {'reserve_estimates': reserves_so_far},
+                    n_done - 1
+                )
+                mean_reserve, std_reserve = bootstrap_engine.reserve_moments(n_done)
+                stats_text = (
+                    f"Mean Reserve: {mean_reserve:,.0f} | "
+                    f"Std Dev: {std_reserve:,.0f}"
+                )
+                progress_text = f"Running all iterations: {n_done}/{n_iterations}"
+
+                return (
+                    store_data, no_update, no_update, dist_fig, stats_fig, progress_text, stats_text,
+                    no_update, no_update
+                )
+
+            # All iterations done - fall through to show the final iteration
+            is_playing, current_iteration, current_frame, bootstrap_complete = False, n_iterations - 1, 0, True
+            store_data.update({
+                'is_playing': is_playing,
+                'current_iteration': current_iteration,
+                'current_frame': current_frame,
+                'bootstrap_complete': bootstrap_complete,
+                'run_all': False
+            })
 
         # If reset was clicked (no iterations but store exists), show empty state
-        if len(bootstrap_engine.iteration_details) == 0:
+        if bootstrap_engine.n_processed == 0:
             # Return empty/initial visualizations
-            empty_triangle = visualizer.create_triangle_heatmap(
-                bootstrap_engine.actual_incremental.values[0, 0],
-                "Bootstrap Triangle - Ready to start",
-                colorscale='Purples',
-                value_divisor=1000,
-                colorbar_title="$000s"
+            empty_triangle, empty_residual, empty_dist, empty_stats = empty_figures(dataset_name)
+            return (
+                store_data if store_data != incoming_store else no_update,
+                empty_triangle, empty_residual, empty_dist, empty_stats, "Ready to start", "",
+                None, None
             )
-            empty_residual = visualizer.create_residual_pool_scatter(
-                bootstrap_engine.residual_pool
-            )
-            empty_dist = visualizer.create_reserve_distribution(
-                [],
-                base_reserve=bootstrap_engine._calculate_base_reserve()
-            )
-            empty_stats = visualizer.create_statistics_panel(
-                {'reserve_estimates': []},
-                0
-            )
-            return store_data, empty_triangle, empty_residual, empty_dist, empty_stats, "Ready to start", ""
 
         # If bootstrap not complete, prevent update unless from store change
         if not bootstrap_complete and ctx.triggered_id != 'iteration-store':
@@ -208,28 +719,36 @@ def register_callbacks(app, bootstrap_engine, visualizer):
         # Check if we need to animate cell-by-cell or jump to next iteration
         animate_cells = show_cell_anim and len(show_cell_anim) > 0
 
-        if current_iteration >= len(bootstrap_engine.iteration_details):
+        # View currently shown in the browser (dataset, iteration, animated)
+        shown = cell_frame or {}
+
+        # Frames advanced in the browser are tracked in cell-frame-store
+        if cell_frame and cell_frame.get('iteration') == current_iteration:
+            current_frame = cell_frame.get('frame', current_frame)
+            store_data['current_frame'] = current_frame
+
+        ensure_recorded(bootstrap_engine, current_iteration)
+        if current_iteration >= bootstrap_engine.n_processed:
             # We've reached the end
             store_data['is_playing'] = False
             raise PreventUpdate
 
-        iteration_detail = bootstrap_engine.iteration_details[current_iteration]
+        iteration_detail = bootstrap_engine.get_iteration_detail(current_iteration)
         n_cells = len(iteration_detail['sampling_details'])
 
-        # Advance frame/iteration (but not if triggered by store update from Run All)
-        if ctx.triggered_id != 'iteration-store':
-            if ctx.triggered_id == 'step-button' or is_playing:
-                if animate_cells:
-                    # Advance frame by frame within iteration
-                    current_frame += 1
-                    if current_frame >= n_cells:
-                        # Move to next iteration
-                        current_iteration += 1
-                        current_frame = 0
-                else:
-                    # Skip animation, jump to next iteration
+        # Advance frame/iteration on steps; playback advances in the browser
+        if ctx.triggered_id == 'step-button':
+            if animate_cells:
+                # Advance frame by frame within iteration
+                current_frame += 1
+                if current_frame >= n_cells:
+                    # Move to next iteration
                     current_iteration += 1
-                    current_frame = n_cells - 1  # Show final state
+                    current_frame = 0
+            else:
+                # Skip animation, jump to next iteration
+                current_iteration += 1
+                current_frame = n_cells - 1  # Show final state
 
             # Update store with new values
             store_data['current_iteration'] = current_iteration
@@ -241,63 +760,69 @@ def register_callbacks(app, bootstrap_engine, visualizer):
             current_iteration = n_iterations - 1
 
         # Get current iteration detail
-        iteration_detail = bootstrap_engine.iteration_details[min(current_iteration, len(bootstrap_engine.iteration_details) - 1)]
+        ensure_recorded(bootstrap_engine, current_iteration)
+        current_iteration = min(current_iteration, bootstrap_engine.n_processed - 1)
+        iteration_detail = bootstrap_engine.get_iteration_detail(current_iteration)
+
+        # Within the iteration already on screen only the changed fields are sent
+        animate_cells = bool(animate_cells)
+        same_view = (
+            shown.get('dataset') == dataset_name and
+            shown.get('iteration') == current_iteration and
+            shown.get('animated') == animate_cells
+        )
 
-        # Create visualizations
-        if animate_cells and current_frame < len(iteration_detail['sampling_details']):
-            # Show animated sampling frame
-            main_fig = visualizer.create_sampling_animation_frame(
-                iteration_detail,
-                current_frame
-            )
+        await_prefetch(dataset_name, current_iteration)
 
+        # Create visualizations (memoised per frame)
+        if animate_cells and current_frame < len(iteration_detail['sampling_details']):
             # Highlight sampled residual in pool
-            current_sample = iteration_detail['sampling_details'][current_frame]
-            # Find the index in residual pool
-            residual_idx = current_sample.get('sampled_residual_index')
-
-            if residual_idx is None and bootstrap_engine.residual_pool:
-                for idx, r in enumerate(bootstrap_engine.residual_pool):
-                    if (
-                        r.get('origin') == current_sample.get('sampled_from_origin') and
-                        r.get('dev') == current_sample.get('sampled_from_dev')
-                    ):
-                        residual_idx = idx
-                        break
-
-            residual_fig = visualizer.create_residual_pool_scatter(
-                bootstrap_engine.residual_pool,
-                highlighted_idx=residual_idx
-            )
+            residual_idx = residual_highlights(dataset_name, current_iteration)[current_frame]
+
+            if same_view:
+                shown_frame = shown.get('frame', 0)
+                main_fig = sampling_frame_patch(dataset_name, current_iteration, current_frame, shown_frame)
+                residual_fig = residual_highlight_patch(
+                    dataset_name, residual_highlights(dataset_name, current_iteration)[shown_frame], residual_idx
+                )
+            else:
+                # Show animated sampling frame
+                main_fig = sampling_frame_figure(dataset_name, current_iteration, current_frame)
+                residual_fig = residual_pool_figure(dataset_name, residual_idx)
+        elif same_view:
+            # Completed bootstrap triangle is already shown
+            main_fig = residual_fig = no_update
         else:
             # Show completed bootstrap triangle
-            main_fig = visualizer.create_triangle_heatmap(
-                iteration_detail['bootstrap_incremental'],
-                f"Bootstrap Triangle - Iteration {current_iteration + 1}",
-                colorscale='Purples',
-                value_divisor=1000,
-                colorbar_title="$000s",
-                hover_suffix=" ($000s)"
-            )
+            main_fig = bootstrap_triangle_figure(dataset_name, current_iteration)
 
-            residual_fig = visualizer.create_residual_pool_scatter(
-                bootstrap_engine.residual_pool
-            )
+            # The pool without a highlight is the same for every iteration
+            if shown.get('dataset') == dataset_name and shown.get('animated') is False:
+                residual_fig = no_update
+            else:
+                residual_fig = residual_pool_figure(dataset_name)
 
         # Create distribution and statistics
-        reserves_so_far = bootstrap_engine.reserve_estimates[:current_iteration + 1]
+        n_so_far = min(current_iteration + 1, len(bootstrap_engine.reserve_estimates))
         current_reserve = iteration_detail['reserve_estimate']
-
-        dist_fig = visualizer.create_reserve_distribution(
-            reserves_so_far,
-            current_estimate=current_reserve,
-            base_reserve=bootstrap_engine._calculate_base_reserve()
+        moments = bootstrap_engine.reserve_moments(n_so_far)
+
+        # Fast-forward playback skips redraws while the distribution has barely moved
+        drawn_moments = shown.get('drawn_moments') if shown.get('dataset') == dataset_name else None
+        converged = (
+            not animate_cells and is_playing and ctx.triggered_id == 'iteration-store' and
+            drawn_moments is not None and all(
+                abs(new - old) <= STATS_REDRAW_TOLERANCE * abs(old)
+                for new, old in zip(moments, drawn_moments)
+            )
         )
 
-        stats_fig = visualizer.create_statistics_panel(
-            {'reserve_estimates': reserves_so_far},
-            current_iteration
-        )
+        if same_view or converged:
+            dist_fig = stats_fig = no_update
+        else:
+            dist_fig = distribution_figure(dataset_name, current_iteration)
+            stats_fig = statistics_figure(dataset_name, current_iteration)
+            drawn_moments = moments
 
         # Progress text
         if animate_cells and current_frame < n_cells:
@@ -305,201 +830,223 @@ def register_callbacks(app, bootstrap_engine, visualizer):
         else:
             progress_text = f"Iteration {current_iteration + 1}/{n_iterations} complete"
 
-        # Statistics text
-        if len(reserves_so_far) > 0:
-            import numpy as np
+        # Statistics text (only changes with the iteration)
+        if same_view:
+            stats_text = no_update
+        elif n_so_far > 0:
+            mean_reserve, std_reserve = moments
             stats_text = (
-                f"Mean Reserve: {np.mean(reserves_so_far):,.0f} | "
-                f"Std Dev: {np.std(reserves_so_far):,.0f} | "
+                f"Mean Reserve: {mean_reserve:,.0f} | "
+                f"Std Dev: {std_reserve:,.0f} | "
                 f"Current: {current_reserve:,.0f}"
             )
         else:
             stats_text = "No statistics yet"
 
-        return store_data, main_fig, residual_fig, dist_fig, stats_fig, progress_text, stats_text
+        # Hand the browser what it needs to keep animating this iteration's cells
+        if animate_cells and not same_view:
+            payload = sampling_payload(dataset_name, current_iteration)
+        else:
+            payload = no_update
+        # Build the next iteration's figures while this one is on screen
+        prefetch_iteration(dataset_name, current_iteration + 1, animate_cells, with_summary=not converged)
+
+        rendered_frame = {
+            'dataset': dataset_name,
+            'iteration': current_iteration,
+            'frame': current_frame,
+            'animated': animate_cells,
+            'drawn_moments': drawn_moments
+        }
+
+        return (
+            store_data if store_data != incoming_store else no_update,
+            main_fig, residual_fig, dist_fig, stats_fig, progress_text, stats_text,
+            payload, rendered_frame
+        )
 
-    @app.callback(
+    # Playback driver (runs in the browser on every interval tick). Ticks only reach
+    # the server while "Run All" streams its batches (via server-tick-store) and when
+    # playback moves on to another iteration (via iteration-store). Frames of the
+    # current iteration are assembled from the payload sent by update_visualization.
+    app.clientside_callback(
+        """
+        function animate_sampling_frame(n_intervals, store_data, payload, cell_frame, show_cell_anim) {
+            const no_update = window.dash_clientside.no_update;
+            const skip = [no_update, no_update, no_update, no_update, no_update, no_update];
+
+            if (!store_data || !store_data.is_playing) {
+                return skip;
+            }
+            if (store_data.run_all && !store_data.bootstrap_complete) {
+                // Run All: the server projects the next batch
+                return [no_update, no_update, no_update, no_update, no_update, n_intervals];
+            }
+            if (!store_data.bootstrap_complete) {
+                return skip;
+            }
+
+            // Wait until the server has rendered the current iteration
+            const iteration = store_data.current_iteration;
+            const animated = Boolean(show_cell_anim && show_cell_anim.length > 0);
+            if (!cell_frame || cell_frame.animated !== animated || cell_frame.iteration !== iteration) {
+                return skip;
+            }
+
+            // Move on to the next iteration (rendered by the server), or stop at the last
+            const next_iteration = (current_frame) => [
+                no_update, no_update, no_update, no_update,
+                Object.assign({}, store_data, iteration + 1 >= store_data.n_iterations
+                    ? {is_playing: false, current_frame: current_frame}
+                    : {current_iteration: iteration + 1, current_frame: 0}),
+                no_update
+            ];
+            if (!animated) {
+                return next_iteration(cell_frame.frame);
+            }
+            if (!payload || payload.iteration !== iteration) {
+                return skip;
+            }
+
+            const n_cells = payload.cells.length;
+            const frame = cell_frame.frame + 1;
+            if (frame >= n_cells) {
+                return next_iteration(n_cells - 1);
+            }
+
+            // Partial bootstrap triangle of the cells sampled so far
+            const empty_grid = () => Array.from({length: payload.n_origin}, () => Array(payload.n_dev).fill(null));
+            const z = empty_grid();
+            const text = Array.from({length: payload.n_origin}, () => Array(payload.n_dev).fill(''));
+            for (let k = 0; k <= frame; k++) {
+                const [o, d] = payload.cells[k];
+                if (payload.values[k] !== null) {
+                    z[o][d] = payload.values[k];
+                    text[o][d] = payload.texts[k];
+                }
+            }
+
+            const template = payload.figure;
+            const [origin, dev] = payload.cells[frame];
+            const layout = Object.assign({}, template.layout, {
+                shapes: [Object.assign({}, template.layout.shapes[0], {
+                    x0: dev - 0.5, x1: dev + 0.5, y0: origin - 0.5, y1: origin + 0.5
+                })],
+                annotations: [Object.assign({}, template.layout.annotations[0], {
+                    text: payload.annotations[frame]
+                })],
+                title: Object.assign({}, template.layout.title, {
+                    text: `Sampling Progress: ${frame + 1} / ${n_cells}`
+                })
+            });
+            const main_fig = {
+                data: [Object.assign({}, template.data[0], {z: z, text: text})],
+                layout: layout
+            };
+
+            // Residual pool with the sampled residual highlighted
+            const pool = payload.residual_figure;
+            const points = pool.data[0];
+            const highlighted = payload.highlights[frame] === null ? [] : [payload.highlights[frame]];
+            const residual_fig = {
+                data: [points, Object.assign({}, pool.data[1], {
+                    x: highlighted,
+                    y: highlighted.map(i => points.y[i]),
+                    text: highlighted.map(i => points.text[i])
+                })],
+                layout: pool.layout
+            };
+
+            const progress = `Iteration ${iteration + 1}/${store_data.n_iterations} - Sampling cell ${frame + 1}/${n_cells}`;
+            return [main_fig, residual_fig, progress, Object.assign({}, cell_frame, {frame: frame}), no_update, no_update];
+        }
+        """,
+        [
+            Output('main-triangle-graph', 'figure', allow_duplicate=True),
+            Output('residual-pool-graph', 'figure', allow_duplicate=True),
+            Output('progress-text', 'children', allow_duplicate=True),
+            Output('cell-frame-store', 'data', allow_duplicate=True),
+            Output('iteration-store', 'data', allow_duplicate=True),
+            Output('server-tick-store', 'data'),
+        ],
+        [Input('interval-component', 'n_intervals')],
+        [
+            State('iteration-store', 'data'),
+            State('animation-payload-store', 'data'),
+            State('cell-frame-store', 'data'),
+            State('show-cell-animation', 'value'),
+        ],
+        prevent_initial_call=True
+    )
+
+    # Toggle between cumulative and incremental triangle display (client-side).
+    # Both heatmaps are prebuilt per dataset in actual-triangle-cache.
+    app.clientside_callback(
+        """
+        function toggle_triangle_mode(cum_clicks, incr_clicks, cache, current_mode) {
+            const triggered = dash_clientside.callback_context.triggered;
+            const triggered_id = triggered.length ? triggered[0].prop_id.split('.')[0] : null;
+
+            let mode = current_mode || 'cumulative';
+            if (triggered_id === 'btn-cumulative') {
+                mode = 'cumulative';
+            } else if (triggered_id === 'btn-incremental') {
+                mode = 'incremental';
+            }
+
+            return [
+                mode,
+                mode === 'cumulative' ? 'primary' : 'secondary',
+                mode === 'incremental' ? 'primary' : 'secondary',
+                cache ? cache[mode] : dash_clientside.no_update
+            ];
+        }
+        """,
         [
             Output('triangle-mode-store', 'data'),
             Output('btn-cumulative', 'color'),
             Output('btn-incremental', 'color'),
+            Output('actual-triangle-graph', 'figure'),
         ],
         [
             Input('btn-cumulative', 'n_clicks'),
             Input('btn-incremental', 'n_clicks'),
+            Input('actual-triangle-cache', 'data'),
         ],
         [State('triangle-mode-store', 'data')],
         prevent_initial_call=True
     )
-    def toggle_triangle_mode(cum_clicks, incr_clicks, current_mode):
-        """Toggle between cumulative and incremental triangle display."""
-        triggered_id = ctx.triggered_id
-
-        if triggered_id == 'btn-cumulative':
-            return 'cumulative', 'primary', 'secondary'
-        elif triggered_id == 'btn-incremental':
-            return 'incremental', 'secondary', 'primary'
-
-        # Default
-        return current_mode, 'primary' if current_mode == 'cumulative' else 'secondary', 'primary' if current_mode == 'incremental' else 'secondary'
-
-    @app.callback(
-        Output('actual-triangle-graph', 'figure'),
-        [Input('triangle-mode-store', 'data')],
-        prevent_initial_call=False
-    )
-    def update_actual_triangle(mode):
-        """Update actual triangle display based on mode."""
-        if mode == 'cumulative':
-            # Get cumulative triangle
-            cumulative_data = bootstrap_engine.triangle.values[0, 0]
-            fig = visualizer.create_triangle_heatmap(
-                cumulative_data,
-                "Actual Loss Triangle (Cumulative)",
-                colorscale='Greens',
-                value_divisor=1000,
-                colorbar_title="$000s",
-                hover_suffix=" ($000s)"
-            )
-        else:
-            # Get incremental triangle
-            incremental_data = bootstrap_engine.actual_incremental.values[0, 0]
-            fig = visualizer.create_triangle_heatmap(
-                incremental_data,
-                "Actual Loss Triangle (Incremental)",
-                colorscale='Greens',
-                value_divisor=1000,
-                colorbar_title="$000s",
-                hover_suffix=" ($000s)"
-            )
-
-        return fig
 
     @app.callback(
         [
+            Output('dataset-info', 'children'),
             Output('original-triangle-graph', 'figure'),
             Output('residual-triangle-graph', 'figure'),
-        ],
-        [Input('interval-component', 'n_intervals')],
-        prevent_initial_call=False
-    )
-    def update_static_triangles(n):
-        """Update static triangle displays (fitted and residuals)."""
-        metadata = bootstrap_engine.get_triangle_metadata()
-
-        # Fitted triangle (expected values from model)
-        fitted_fig = visualizer.create_triangle_heatmap(
-            metadata['fitted_incremental'],
-            "Fitted Incremental Triangle (Model Expected Values)",
-            colorscale='Blues',
-            value_divisor=1000,
-            colorbar_title="$000s",
-            hover_suffix=" ($000s)"
-        )
-
-        # Residual triangle
-        residual_fig = visualizer.create_triangle_heatmap(
-            metadata['residuals'],
-            "Pearson Residuals",
-            colorscale='RdBu',
-            text_format="{:,.2f}",
-            hover_format="{:,.2f}",
-            colorbar_title="Residual"
-        )
-
-        return fitted_fig, residual_fig
-
-    @app.callback(
-        [
-            Output('dataset-info', 'children'),
+            Output('dev-factors-display', 'children'),
+            Output('actual-triangle-cache', 'data'),
         ],
         [Input('dataset-dropdown', 'value')],
         prevent_initial_call=False
     )
     def update_dataset(dataset_name):
-        """Update dataset when dropdown changes."""
-        import chainladder as cl
-        from dash import html
-
-        # Load the selected dataset
-        if dataset_name == 'genins':
-            triangle = cl.load_sample('genins')
-        elif dataset_name == 'raa':
-            triangle = cl.load_sample('raa')
-        elif dataset_name == 'abc':
-            triangle = cl.load_sample('abc')
-        elif dataset_name == 'quarterly':
-            triangle = cl.load_sample('quarterly')
-        elif dataset_name == 'ukmotor':
-            triangle = cl.load_sample('ukmotor')
-        elif dataset_name == 'mw2008':
-            triangle = cl.load_sample('MW2008')
-        elif dataset_name == 'mw2014':
-            triangle = cl.load_sample('MW2014')
-        else:
-            triangle = cl.load_sample('genins')
-
-        # Update the bootstrap engine with new dataset
-        bootstrap_engine.__init__(triangle_data=triangle, random_state=42)
+        """Update dataset info, static triangle displays and development factors when dropdown changes."""
+        # Engines are cached per dataset; start the selected one from a clean run
+        bootstrap_engine = get_engine(dataset_name)
+        clear_figure_caches()
+        bootstrap_engine.reset_results()
 
         # Get new metadata
         metadata = bootstrap_engine.get_triangle_metadata()
 
-        # Update visualizer metadata
-        visualizer.metadata = metadata
-
-        # Return updated info display
-        return [html.P([
+        # Updated info display
+        dataset_info = html.P([
             html.Strong("Size: "),
             f"{metadata['n_origin']} accident years × {metadata['n_dev']} development periods | ",
             html.Strong("Base Reserve: "),
             f"${metadata['base_reserve']:,.0f}"
-        ], className="mb-0", style={'marginTop': '8px'})]
+        ], className="mb-0", style={'marginTop': '8px'})
 
-    @app.callback(
-        Output('dev-factors-display', 'children'),
-        [Input('dataset-dropdown', 'value')],
-        prevent_initial_call=False
-    )
-    def update_dev_factors(dataset_name):
-        """Display incremental and cumulative development factors."""
-        from dash import html
-        import dash_bootstrap_components as dbc
-        import numpy as np
-
-        # Get the current triangle's development factors
-        model = bootstrap_engine.base_model
-        ldf = model.ldf_.values[0, 0, 0, :]
-        cdf = model.cdf_.values[0, 0, 0, :]
-
-        # Get development period labels
-        n_dev = len(ldf)
-        dev_periods = bootstrap_engine.triangle.development.values
-
-        # Create headers for development period pairs
-        headers = []
-        for i in range(n_dev):
-            if i < len(dev_periods) - 1:
-                headers.append(f"{dev_periods[i]}-{dev_periods[i+1]}")
-
-        # Build table with both incremental and cumulative LDFs
-        table_header = [
-            html.Thead(html.Tr([html.Th("Factor Type")] + [html.Th(h, style={'textAlign': 'center'}) for h in headers]))
-        ]
-
-        # Incremental LDF row
-        incr_cells = [html.Td("Incremental LDF", style={'fontWeight': 'bold'})]
-        for i in range(len(headers)):
-            incr_cells.append(html.Td(f"{ldf[i]:.4f}", style={'textAlign': 'center'}))
+        fitted_fig, residual_fig, actual_figs = dataset_figures(dataset_name)
+        dev_factors = dev_factor_table(dataset_name)
 
-        # Cumulative LDF row
-        cum_cells = [html.Td("Cumulative LDF", style={'fontWeight': 'bold'})]
-        for i in range(len(headers)):
-            cum_cells.append(html.Td(f"{cdf[i]:.4f}", style={'textAlign': 'center'}))
-
-        table_body = [html.Tbody([
-            html.Tr(incr_cells),
-            html.Tr(cum_cells)
-        ])]
-
-        return dbc.Table(table_header + table_body, bordered=True, hover=True, striped=True, size='sm')
+        return dataset_info, fitted_fig, residual_fig, dev_factors, actual_figs
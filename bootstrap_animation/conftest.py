@@ -0,0 +1,58 @@
+"""
+Shared pytest fixtures for the Bootstrap Animation test suite
+
+The engine (which loads the triangle and fits the chain ladder model) and its
+visualizer are built once per test session and shared by the tests, which only
+read them. Tests that run the engine themselves use fresh_engine instead. Tests
+that depend on them are skipped when a dependency is missing; test_import reports it.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Bootstrap engine on the default GenIns triangle."""
+    pytest.importorskip("chainladder")
+    from bootstrap_engine import AnimatedBootstrapODP
+
+    return AnimatedBootstrapODP(random_state=42)
+
+
+@pytest.fixture
+def fresh_engine():
+    """Bootstrap engine of the test's own, for tests that change its run state."""
+    pytest.importorskip("chainladder")
+    from bootstrap_engine import AnimatedBootstrapODP
+
+    return AnimatedBootstrapODP(random_state=42)
+
+
+@pytest.fixture(scope="session")
+def metadata(engine):
+    """Triangle metadata of the shared engine."""
+    return engine.get_triangle_metadata()
+
+
+@pytest.fixture(scope="session")
+def single_iteration(engine):
+    """First bootstrap iteration of the shared engine, with its sampling details."""
+    return engine.run_single_iteration(0)
+
+
+@pytest.fixture(scope="session")
+def bootstrap_summary(engine):
+    """Summary of one 10-iteration bootstrap run, shared by the tests that need reserves."""
+    summary = engine.run_bootstrap(n_iterations=10)
+    # Detach the reserves from the engine's buffer, which later runs reuse
+    summary['reserve_estimates'] = summary['reserve_estimates'].copy()
+    return summary
+
+
+@pytest.fixture(scope="session")
+def visualizer(metadata):
+    """Visualizer for the shared engine's triangle."""
+    pytest.importorskip("plotly")
+    from visualization import BootstrapVisualizer
+
+    return BootstrapVisualizer(metadata)
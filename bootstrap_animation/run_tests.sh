@@ -24,8 +24,8 @@ fi
 
 echo ""
 
-# Run tests
-python test_comprehensive.py
+# Run tests (spread over all CPU cores by pytest-xdist)
+python -m pytest -n auto test_comprehensive.py
 
 # Capture exit code
 TEST_EXIT_CODE=$?
@@ -1,576 +1,408 @@
 """
 Comprehensive Test Suite for Bootstrap Animation Application
 Tests all components with detailed error reporting for debugging
+
+Run with pytest; tests are independent, so they can be spread over CPU cores:
+
+    pytest -n auto test_comprehensive.py
 """
 
+import importlib
+import json
+import logging
+import os
+import shutil
+import subprocess
 import sys
-import traceback
-from typing import Callable, Any
-
-
-class TestRunner:
-    """Test runner with detailed error reporting."""
-
-    def __init__(self):
-        self.tests_run = 0
-        self.tests_passed = 0
-        self.tests_failed = 0
-        self.failures = []
-
-    def run_test(self, test_name: str, test_func: Callable) -> bool:
-        """Run a single test with error handling."""
-        self.tests_run += 1
-        print(f"\n{'='*70}")
-        print(f"TEST {self.tests_run}: {test_name}")
-        print('='*70)
-
-        try:
-            result = test_func()
-            if result:
-                print(f"✓ PASSED: {test_name}")
-                self.tests_passed += 1
-                return True
-            else:
-                print(f"✗ FAILED: {test_name} - Test returned False")
-                self.tests_failed += 1
-                self.failures.append((test_name, "Test returned False"))
-                return False
-        except Exception as e:
-            print(f"\n✗ FAILED: {test_name}")
-            print(f"\nError Type: {type(e).__name__}")
-            print(f"Error Message: {str(e)}")
-            print(f"\nFull Traceback:")
-            print("-" * 70)
-            traceback.print_exc()
-            print("-" * 70)
-            self.tests_failed += 1
-            self.failures.append((test_name, str(e)))
-            return False
-
-    def print_summary(self):
-        """Print test summary."""
-        print("\n" + "="*70)
-        print("TEST SUMMARY")
-        print("="*70)
-        print(f"Total Tests: {self.tests_run}")
-        print(f"Passed: {self.tests_passed} ✓")
-        print(f"Failed: {self.tests_failed} ✗")
-        print(f"Success Rate: {(self.tests_passed/self.tests_run*100):.1f}%")
-
-        if self.failures:
-            print("\n" + "="*70)
-            print("FAILED TESTS SUMMARY")
-            print("="*70)
-            for i, (test_name, error) in enumerate(self.failures, 1):
-                print(f"\n{i}. {test_name}")
-                print(f"   Error: {error}")
-
-        print("\n" + "="*70)
-        if self.tests_failed == 0:
-            print("🎉 ALL TESTS PASSED! 🎉")
-        else:
-            print(f"⚠️  {self.tests_failed} TEST(S) FAILED")
-        print("="*70 + "\n")
-
-        return self.tests_failed == 0
-
-
-def test_python_version() -> bool:
+
+import pytest
+
+# Test progress is logged at DEBUG; show it with --log-cli-level=DEBUG
+log = logging.getLogger(__name__)
+
+
+def _assert_has_all(obj, names, what):
+    """Assert that obj has all names: keys for a dict, attributes otherwise."""
+    present = obj.keys() if isinstance(obj, dict) else set(dir(obj))
+    missing = set(names) - present
+    assert not missing, f"Missing {what}: {sorted(missing)}"
+    log.debug(f"✓ All {what} present: {list(names)}")
+
+
+# Directory holding the application modules and files under test
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_python_version():
     """Test Python version compatibility."""
-    print(f"Python version: {sys.version}")
+    log.debug(f"Python version: {sys.version}")
     major, minor = sys.version_info[:2]
-    print(f"Version info: {major}.{minor}")
+    log.debug(f"Version info: {major}.{minor}")
 
-    if major < 3:
-        print(f"✗ Python 3.x required, found {major}.{minor}")
-        return False
+    assert major >= 3, f"Python 3.x required, found {major}.{minor}"
 
     if major == 3 and minor < 8:
-        print(f"⚠️  Warning: Python 3.8+ recommended, found {major}.{minor}")
+        log.debug(f"⚠️  Warning: Python 3.8+ recommended, found {major}.{minor}")
 
-    print(f"✓ Python version {major}.{minor} is compatible")
-    return True
+    log.debug(f"✓ Python version {major}.{minor} is compatible")
 
 
-def test_import_standard_libs() -> bool:
+def test_import_standard_libs():
     """Test standard library imports."""
     required_modules = ['os', 'sys', 'subprocess', 'typing', 'traceback']
 
     for module in required_modules:
-        try:
-            __import__(module)
-            print(f"✓ {module}")
-        except ImportError as e:
-            print(f"✗ Failed to import {module}: {e}")
-            return False
-
-    return True
-
-
-def test_import_numpy() -> bool:
-    """Test NumPy import and basic functionality."""
-    try:
-        import numpy as np
-        print(f"✓ NumPy version: {np.__version__}")
-
-        # Test basic operations
-        arr = np.array([1, 2, 3, 4, 5])
-        mean = np.mean(arr)
-        print(f"✓ NumPy operations working (test mean: {mean})")
-
-        return True
-    except ImportError as e:
-        print(f"✗ NumPy not installed: {e}")
-        return False
-    except Exception as e:
-        print(f"✗ NumPy error: {e}")
-        return False
-
-
-def test_import_pandas() -> bool:
-    """Test Pandas import and basic functionality."""
-    try:
-        import pandas as pd
-        print(f"✓ Pandas version: {pd.__version__}")
-
-        # Test basic DataFrame
-        df = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
-        print(f"✓ Pandas operations working (test df shape: {df.shape})")
-
-        return True
-    except ImportError as e:
-        print(f"✗ Pandas not installed: {e}")
-        return False
-    except Exception as e:
-        print(f"✗ Pandas error: {e}")
-        return False
-
-
-def test_import_chainladder() -> bool:
-    """Test chainladder import and basic functionality."""
-    try:
-        import chainladder as cl
-        print(f"✓ chainladder version: {cl.__version__}")
-
-        # Test loading sample data
-        tri = cl.load_sample('genins')
-        print(f"✓ Sample triangle loaded: shape {tri.shape}")
-
-        # Test basic model
-        model = cl.Chainladder().fit(tri)
-        print(f"✓ Chainladder model fitted successfully")
-
-        return True
-    except ImportError as e:
-        print(f"✗ chainladder not installed: {e}")
-        print("\nTo install: pip install chainladder")
-        return False
-    except Exception as e:
-        print(f"✗ chainladder error: {e}")
-        return False
-
-
-def test_import_plotly() -> bool:
-    """Test Plotly import and basic functionality."""
-    try:
-        import plotly
-        import plotly.graph_objects as go
-        print(f"✓ Plotly version: {plotly.__version__}")
-
-        # Test creating a simple figure
-        fig = go.Figure(data=go.Scatter(x=[1, 2, 3], y=[4, 5, 6]))
-        print(f"✓ Plotly figure creation working")
-
-        return True
-    except ImportError as e:
-        print(f"✗ Plotly not installed: {e}")
-        print("\nTo install: pip install plotly")
-        return False
-    except Exception as e:
-        print(f"✗ Plotly error: {e}")
-        return False
-
-
-def test_import_dash() -> bool:
-    """Test Dash import and basic functionality."""
-    try:
-        import dash
-        from dash import dcc, html
-        print(f"✓ Dash version: {dash.__version__}")
-
-        # Test basic app creation
-        app = dash.Dash(__name__)
-        print(f"✓ Dash app creation working")
-
-        return True
-    except ImportError as e:
-        print(f"✗ Dash not installed: {e}")
-        print("\nTo install: pip install dash")
-        return False
-    except Exception as e:
-        print(f"✗ Dash error: {e}")
-        return False
-
-
-def test_import_dash_bootstrap() -> bool:
-    """Test Dash Bootstrap Components import."""
-    try:
-        import dash_bootstrap_components as dbc
-        print(f"✓ dash-bootstrap-components version: {dbc.__version__}")
-
-        # Test basic component
-        card = dbc.Card("Test")
-        print(f"✓ Bootstrap components working")
-
-        return True
-    except ImportError as e:
-        print(f"✗ dash-bootstrap-components not installed: {e}")
-        print("\nTo install: pip install dash-bootstrap-components")
-        return False
-    except Exception as e:
-        print(f"✗ dash-bootstrap-components error: {e}")
-        return False
-
-
-def test_bootstrap_engine_import() -> bool:
-    """Test bootstrap_engine module import."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
-        print(f"✓ bootstrap_engine module imported")
-        print(f"✓ AnimatedBootstrapODP class available")
-
-        return True
-    except ImportError as e:
-        print(f"✗ Failed to import bootstrap_engine: {e}")
-        print("\nCheck that bootstrap_engine.py exists in the current directory")
-        return False
-    except Exception as e:
-        print(f"✗ bootstrap_engine error: {e}")
-        return False
-
-
-def test_visualization_import() -> bool:
-    """Test visualization module import."""
-    try:
-        from visualization import BootstrapVisualizer
-        print(f"✓ visualization module imported")
-        print(f"✓ BootstrapVisualizer class available")
-
-        return True
-    except ImportError as e:
-        print(f"✗ Failed to import visualization: {e}")
-        print("\nCheck that visualization.py exists in the current directory")
-        return False
-    except Exception as e:
-        print(f"✗ visualization error: {e}")
-        return False
-
-
-def test_callbacks_import() -> bool:
-    """Test callbacks module import."""
-    try:
-        from callbacks import register_callbacks
-        print(f"✓ callbacks module imported")
-        print(f"✓ register_callbacks function available")
-
-        return True
-    except ImportError as e:
-        print(f"✗ Failed to import callbacks: {e}")
-        print("\nCheck that callbacks.py exists in the current directory")
-        return False
-    except Exception as e:
-        print(f"✗ callbacks error: {e}")
-        return False
-
-
-def test_bootstrap_engine_initialization() -> bool:
+        __import__(module)
+        log.debug(f"✓ {module}")
+
+
+@pytest.mark.parametrize("module_name, attributes", [
+    ("numpy", ["ndarray"]),
+    ("pandas", ["DataFrame"]),
+    ("chainladder", ["Chainladder", "BootstrapODPSample", "load_sample"]),
+    ("plotly.graph_objects", ["Figure"]),
+    ("dash", ["Dash"]),
+    ("dash_bootstrap_components", ["Card"]),
+    ("bootstrap_engine", ["AnimatedBootstrapODP"]),
+    ("visualization", ["BootstrapVisualizer"]),
+    ("callbacks", ["register_callbacks"]),
+])
+def test_import(module_name, attributes):
+    """Test that a dependency or application module imports and provides what the app uses."""
+    module = importlib.import_module(module_name)
+    version = getattr(sys.modules[module_name.split('.')[0]], '__version__', None)
+    log.debug(f"✓ {module_name} imported" + (f" (version {version})" if version else ""))
+
+    _assert_has_all(module, attributes, f"{module_name} attributes")
+
+
+def test_bootstrap_engine_initialization(engine):
     """Test AnimatedBootstrapODP initialization."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
+    log.debug("✓ Engine initialized successfully")
 
-        print("Initializing AnimatedBootstrapODP...")
-        engine = AnimatedBootstrapODP(random_state=42)
-        print(f"✓ Engine initialized successfully")
+    # Check attributes
+    attrs = ['triangle', 'base_model', '_fitted_incr_arr', 'actual_incremental',
+             'fitted_incremental', 'residual_pool', 'random_state']
+    _assert_has_all(engine, attrs, "attributes")
 
-        # Check attributes
-        attrs = ['triangle', 'base_model', 'fitted_values', 'actual_incremental',
-                 'fitted_incremental', 'residual_pool', 'random_state']
-        for attr in attrs:
-            if not hasattr(engine, attr):
-                print(f"✗ Missing attribute: {attr}")
-                return False
-            print(f"✓ Attribute '{attr}' present")
 
-        print(f"✓ All required attributes present")
-        return True
+def test_bootstrap_engine_metadata(metadata):
+    """Test getting triangle metadata."""
+    log.debug("✓ Metadata retrieved")
 
-    except Exception as e:
-        print(f"✗ Engine initialization failed: {e}")
-        return False
+    # Check metadata contents
+    required_keys = ['n_origin', 'n_dev', 'origin_labels', 'development_labels',
+                     'actual_incremental', 'fitted_incremental', 'residuals',
+                     'residual_pool', 'base_reserve']
 
+    _assert_has_all(metadata, required_keys, "metadata keys")
 
-def test_bootstrap_engine_metadata() -> bool:
-    """Test getting triangle metadata."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
+    log.debug("Metadata Summary:")
+    log.debug(f"  Triangle size: {metadata['n_origin']} × {metadata['n_dev']}")
+    log.debug(f"  Base reserve: ${metadata['base_reserve']:,.2f}")
+    log.debug(f"  Residual pool size: {len(metadata['residual_pool'])}")
 
-        engine = AnimatedBootstrapODP(random_state=42)
-        metadata = engine.get_triangle_metadata()
-        print(f"✓ Metadata retrieved")
 
-        # Check metadata contents
-        required_keys = ['n_origin', 'n_dev', 'origin_labels', 'development_labels',
-                        'actual_incremental', 'fitted_incremental', 'residuals',
-                        'residual_pool', 'base_reserve']
+def test_single_iteration_keys(single_iteration):
+    """Test the result structure of a single bootstrap iteration."""
+    result = single_iteration
+    log.debug("✓ Single iteration completed")
 
-        for key in required_keys:
-            if key not in metadata:
-                print(f"✗ Missing metadata key: {key}")
-                return False
-            print(f"✓ Metadata key '{key}': {type(metadata[key]).__name__}")
+    # Check result structure
+    required_keys = ['iteration', 'sampling_details', 'bootstrap_incremental',
+                     'bootstrap_cumulative', 'reserve_estimate']
 
-        print(f"\nMetadata Summary:")
-        print(f"  Triangle size: {metadata['n_origin']} × {metadata['n_dev']}")
-        print(f"  Base reserve: ${metadata['base_reserve']:,.2f}")
-        print(f"  Residual pool size: {len(metadata['residual_pool'])}")
+    _assert_has_all(result, required_keys, "result keys")
 
-        return True
+    log.debug("Iteration Results:")
+    log.debug(f"  Reserve estimate: ${result['reserve_estimate']:,.2f}")
 
-    except Exception as e:
-        print(f"✗ Metadata retrieval failed: {e}")
-        return False
 
+def test_single_iteration_shape(single_iteration, metadata):
+    """Test that a single iteration's bootstrap triangles match the actual triangle."""
+    expected_shape = (metadata['n_origin'], metadata['n_dev'])
 
-def test_bootstrap_single_iteration() -> bool:
-    """Test running a single bootstrap iteration."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
+    for key in ('bootstrap_incremental', 'bootstrap_cumulative'):
+        shape = single_iteration[key].shape
+        assert shape == expected_shape, f"{key} has shape {shape}, expected {expected_shape}"
+        log.debug(f"✓ {key} shape: {shape}")
 
-        engine = AnimatedBootstrapODP(random_state=42)
-        print("Running single iteration...")
 
-        result = engine.run_single_iteration(0)
-        print(f"✓ Single iteration completed")
+def test_single_iteration_samples(single_iteration):
+    """Test the sampling details recorded for a single iteration."""
+    sampling_details = single_iteration['sampling_details']
+    log.debug(f"  Samples taken: {len(sampling_details)}")
+    assert len(sampling_details) > 0, "No sampling details recorded"
 
-        # Check result structure
-        required_keys = ['iteration', 'sampling_details', 'bootstrap_incremental',
-                        'bootstrap_cumulative', 'reserve_estimate']
+    # Fields the sampling animation reads from every sample
+    required_keys = ['origin', 'dev', 'fitted', 'bootstrap_value', 'sampled_residual',
+                     'sampled_from_origin', 'sampled_from_dev']
+    _assert_has_all(sampling_details[0], required_keys, "sample detail keys")
+    log.debug(f"First sample detail keys: {list(sampling_details[0].keys())}")
 
-        for key in required_keys:
-            if key not in result:
-                print(f"✗ Missing result key: {key}")
-                return False
-            print(f"✓ Result key '{key}' present")
 
-        print(f"\nIteration Results:")
-        print(f"  Reserve estimate: ${result['reserve_estimate']:,.2f}")
-        print(f"  Samples taken: {len(result['sampling_details'])}")
-        print(f"  Bootstrap triangle shape: {result['bootstrap_incremental'].shape}")
+def test_bootstrap_multiple_iterations(bootstrap_summary):
+    """Test running multiple bootstrap iterations."""
+    summary = bootstrap_summary
+    log.debug(f"✓ {summary['n_iterations']} iterations completed")
+
+    # Check summary structure
+    required_keys = ['n_iterations', 'reserve_estimates', 'mean', 'std', 'percentiles']
+    _assert_has_all(summary, required_keys, "summary keys")
+
+    log.debug("Bootstrap Summary:")
+    log.debug(f"  Iterations: {summary['n_iterations']}")
+    log.debug(f"  Mean reserve: ${summary['mean']:,.2f}")
+    log.debug(f"  Std deviation: ${summary['std']:,.2f}")
+    log.debug(f"  5th percentile: ${summary['percentiles']['5']:,.2f}")
+    log.debug(f"  95th percentile: ${summary['percentiles']['95']:,.2f}")
+
+    # Verify variation (one reduction over the reserves array)
+    assert summary['reserve_estimates'].std() > 0, "Zero standard deviation (no variation)"
+    log.debug("✓ Proper variation detected")
+
+
+def test_iteration_detail_lookup(fresh_engine):
+    """Test looking up an iteration's details by number after a run that recorded none."""
+    engine = fresh_engine
+    engine.run_bootstrap(n_iterations=10)
+    assert engine.iteration_details == [], "Bulk run recorded iteration details"
+
+    # Built on demand from the resampled triangles, then recorded
+    detail = engine.get_iteration_detail(7)
+    assert detail['iteration'] == 7
+    assert detail['reserve_estimate'] == engine.reserve_estimates[7]
+    assert engine.get_iteration_detail(7) is detail, "Details rebuilt instead of recorded"
+    log.debug("✓ Iteration 7 details built on demand")
+
+    with pytest.raises(IndexError):
+        engine.get_iteration_detail(10)
+
+
+def test_concurrent_recording(fresh_engine):
+    """Test that iterations recorded from several threads at once are each recorded once."""
+    import threading
+
+    # Request threads project and record iterations while the prefetch thread reads them
+    engine = fresh_engine
+    engine.prepare_bootstrap(200)
+
+    def worker(projects):
+        for iteration in range(200):
+            if projects:
+                engine.run_single_iteration(iteration)
+            elif iteration < engine.n_processed:
+                engine.get_iteration_detail(iteration)
 
-        # Verify sampling details
-        if len(result['sampling_details']) > 0:
-            sample = result['sampling_details'][0]
-            print(f"\nFirst sample detail keys: {list(sample.keys())}")
+    threads = [threading.Thread(target=worker, args=(k % 2 == 0,)) for k in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
 
-        return True
+    recorded = sorted(detail['iteration'] for detail in engine.iteration_details)
+    assert recorded == list(range(200)), "Iterations recorded twice or missing"
+    log.debug("✓ 200 iterations recorded once each from 6 threads")
+
+
+@pytest.mark.parametrize("sample", ['genins', 'raa', 'abc', 'quarterly', 'ukmotor', 'MW2008', 'MW2014'])
+def test_reserve_kernel_matches_chainladder(sample):
+    """Test the engine's reserve kernel against cl.Chainladder on the app's sample datasets."""
+    cl = pytest.importorskip("chainladder")
+    import numpy as np
+    from bootstrap_engine import _make_reserve_kernel
+
+    triangle = cl.load_sample(sample).iloc[0, 0]
+    cumulative = triangle.values[0, 0]
+    kernel = _make_reserve_kernel(~np.isnan(cumulative))
+
+    reserve = kernel(cumulative[np.newaxis])[0]
+    expected = cl.Chainladder().fit(triangle).ibnr_.sum()
+    assert reserve == pytest.approx(expected, rel=1e-6)
+    log.debug(f"✓ {sample}: kernel reserve {reserve:,.2f} matches chainladder")
+
+    # Resampled triangles, which the kernel projects in batches
+    resampled = cl.BootstrapODPSample(n_sims=5, random_state=42, hat_adj=False).fit(triangle).resampled_triangles_
+    reserves = kernel(resampled.values[:, 0])
+    expected = cl.Chainladder().fit(resampled).ibnr_.sum('origin').values.ravel()
+    np.testing.assert_allclose(reserves, expected, rtol=1e-6)
 
-    except Exception as e:
-        print(f"✗ Single iteration failed: {e}")
-        return False
 
+@pytest.mark.parametrize("sample", ['genins', 'raa', 'ukmotor'])
+def test_old_engine_future_payments_match_chainladder(sample):
+    """Test the old engine's projected future payments against cl.Chainladder reserves."""
+    cl = pytest.importorskip("chainladder")
+    import numpy as np
+    from bootstrap_engine_old import _chainladder_future_payments
 
-def test_bootstrap_multiple_iterations() -> bool:
-    """Test running multiple bootstrap iterations."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
-        import numpy as np
-
-        engine = AnimatedBootstrapODP(random_state=42)
-        n_iterations = 10
-        print(f"Running {n_iterations} iterations...")
-
-        summary = engine.run_bootstrap(n_iterations=n_iterations)
-        print(f"✓ {n_iterations} iterations completed")
-
-        # Check summary structure
-        required_keys = ['n_iterations', 'reserve_estimates', 'mean', 'std', 'percentiles']
-        for key in required_keys:
-            if key not in summary:
-                print(f"✗ Missing summary key: {key}")
-                return False
-            print(f"✓ Summary key '{key}' present")
-
-        print(f"\nBootstrap Summary:")
-        print(f"  Iterations: {summary['n_iterations']}")
-        print(f"  Mean reserve: ${summary['mean']:,.2f}")
-        print(f"  Std deviation: ${summary['std']:,.2f}")
-        print(f"  5th percentile: ${summary['percentiles']['5']:,.2f}")
-        print(f"  95th percentile: ${summary['percentiles']['95']:,.2f}")
-
-        # Verify variation
-        if summary['std'] == 0:
-            print(f"⚠️  Warning: Zero standard deviation (no variation)")
-        else:
-            print(f"✓ Proper variation detected")
-
-        return True
-
-    except Exception as e:
-        print(f"✗ Multiple iterations failed: {e}")
-        return False
-
-
-def test_visualizer_initialization() -> bool:
-    """Test BootstrapVisualizer initialization."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
-        from visualization import BootstrapVisualizer
+    triangle = cl.load_sample(sample)
+    payments = _chainladder_future_payments(triangle.values[0, 0])
 
-        engine = AnimatedBootstrapODP(random_state=42)
-        metadata = engine.get_triangle_metadata()
+    # Future payments of each origin are its chain ladder IBNR
+    expected = cl.Chainladder().fit(triangle).ibnr_.values[0, 0, :, 0]
+    np.testing.assert_allclose(payments.sum(axis=-1), np.nan_to_num(expected), rtol=1e-6, atol=1e-6)
 
-        print("Initializing visualizer...")
-        visualizer = BootstrapVisualizer(metadata)
-        print(f"✓ Visualizer initialized")
+    # A stacked batch projects each triangle on its own
+    resampled = cl.BootstrapODPSample(n_sims=5, random_state=42, hat_adj=False).fit(triangle).resampled_triangles_
+    batch_payments = _chainladder_future_payments(resampled.values[:, 0])
+    expected = cl.Chainladder().fit(resampled).ibnr_.sum('origin').values.ravel()
+    np.testing.assert_allclose(batch_payments.sum(axis=(-2, -1)), expected, rtol=1e-6)
+    log.debug(f"✓ {sample}: old engine reserve {payments.sum():,.2f} matches chainladder")
 
-        # Check attributes
-        attrs = ['metadata', 'n_origin', 'n_dev', 'origin_labels', 'dev_labels']
-        for attr in attrs:
-            if not hasattr(visualizer, attr):
-                print(f"✗ Missing attribute: {attr}")
-                return False
-            print(f"✓ Attribute '{attr}' present")
 
-        return True
+def test_old_engine_mean_reserve():
+    """Test that the old engine's bootstrap mean reserve stays near the chain ladder reserve."""
+    pytest.importorskip("chainladder")
+    from bootstrap_engine_old import AnimatedBootstrapODP as OldBootstrapODP
 
-    except Exception as e:
-        print(f"✗ Visualizer initialization failed: {e}")
-        return False
+    old_engine = OldBootstrapODP(random_state=42)
+    mean = old_engine.run_bootstrap(200)['mean']
+    base = old_engine._calculate_base_reserve()
+    assert mean == pytest.approx(base, rel=0.05), f"Mean reserve {mean:,.0f} far from chain ladder {base:,.0f}"
 
 
-def test_visualizer_triangle_heatmap() -> bool:
-    """Test creating triangle heatmap visualization."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
-        from visualization import BootstrapVisualizer
+def test_resample_prefix_stability():
+    """Test that BootstrapODPSample's first k resamples do not depend on n_sims.
 
-        engine = AnimatedBootstrapODP(random_state=42)
-        metadata = engine.get_triangle_metadata()
-        visualizer = BootstrapVisualizer(metadata)
+    The engine grows a run by resampling more triangles and keeps the iterations
+    already processed, which is only valid while this holds.
+    """
+    cl = pytest.importorskip("chainladder")
+    import numpy as np
 
-        print("Creating triangle heatmap...")
-        fig = visualizer.create_triangle_heatmap(
-            metadata['actual_incremental'],
-            "Test Triangle"
-        )
-        print(f"✓ Triangle heatmap created")
-        print(f"  Figure type: {type(fig).__name__}")
+    triangle = cl.load_sample('genins')
 
-        return True
+    def resampled(n_sims):
+        sample = cl.BootstrapODPSample(n_sims=n_sims, random_state=42, hat_adj=False).fit(triangle)
+        return sample.resampled_triangles_.values
 
-    except Exception as e:
-        print(f"✗ Triangle heatmap creation failed: {e}")
-        return False
+    np.testing.assert_array_equal(resampled(8), resampled(16)[:8])
+    log.debug(f"✓ First 8 resamples identical for n_sims=8 and n_sims=16 (chainladder {cl.__version__})")
 
 
-def test_visualizer_residual_scatter() -> bool:
-    """Test creating residual pool scatter plot."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
-        from visualization import BootstrapVisualizer
+def test_resampled_triangles_reused_across_runs(fresh_engine):
+    """Test that a run reusing a larger run's resampled triangles matches a fresh run."""
+    import numpy as np
+    from bootstrap_engine import AnimatedBootstrapODP
 
-        engine = AnimatedBootstrapODP(random_state=42)
-        metadata = engine.get_triangle_metadata()
-        visualizer = BootstrapVisualizer(metadata)
+    engine = fresh_engine
+    engine.run_bootstrap(n_iterations=30)
+    reused = engine.run_bootstrap(n_iterations=10)['reserve_estimates'].copy()
+    assert engine._resampled_cumulative.shape[0] >= 30, "Smaller run resampled again"
 
-        print("Creating residual scatter plot...")
-        fig = visualizer.create_residual_pool_scatter(metadata['residual_pool'])
-        print(f"✓ Residual scatter plot created")
+    fresh = AnimatedBootstrapODP(random_state=42).run_bootstrap(n_iterations=10)['reserve_estimates']
+    np.testing.assert_array_equal(reused, fresh)
+    log.debug("✓ Reused resamples give the same reserves as a fresh run")
 
-        return True
 
-    except Exception as e:
-        print(f"✗ Residual scatter plot creation failed: {e}")
-        return False
+def test_residual_matches_brute_force(engine):
+    """Test the binary-search residual matching against a brute-force nearest neighbour."""
+    import numpy as np
 
+    pool = engine._residual_adjusted_values.astype(np.float32)
+    rng = np.random.default_rng(0)
+    values = np.concatenate([
+        rng.uniform(pool.min() - 1, pool.max() + 1, 500),
+        pool,  # exact hits
+        [pool.min() - 100, pool.max() + 100, 0.0]
+    ]).astype(np.float32)
 
-def test_visualizer_distribution() -> bool:
-    """Test creating reserve distribution histogram."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
-        from visualization import BootstrapVisualizer
+    # Closest pool residual, ties going to the lowest pool index (argmin's first)
+    expected = np.abs(values[:, np.newaxis] - pool[np.newaxis, :]).argmin(axis=1)
+    np.testing.assert_array_equal(engine._find_residual_matches(values), expected)
+    log.debug(f"✓ {len(values)} residual matches agree with brute force")
 
-        engine = AnimatedBootstrapODP(random_state=42)
-        metadata = engine.get_triangle_metadata()
-        visualizer = BootstrapVisualizer(metadata)
 
-        # Run some iterations to get data
-        engine.run_bootstrap(n_iterations=10)
+def test_reserve_moments(fresh_engine):
+    """Test the running reserve mean and std against NumPy on the processed reserves."""
+    import numpy as np
 
-        print("Creating distribution histogram...")
-        fig = visualizer.create_reserve_distribution(
-            engine.reserve_estimates,
-            base_reserve=metadata['base_reserve']
-        )
-        print(f"✓ Distribution histogram created")
+    engine = fresh_engine
+    engine.run_bootstrap(n_iterations=20)
+    reserves = engine.reserve_estimates
 
-        return True
+    for n in (1, 7, 20):
+        mean, std = engine.reserve_moments(n)
+        assert mean == pytest.approx(np.mean(reserves[:n]), rel=1e-9)
+        assert std == pytest.approx(np.std(reserves[:n]), rel=1e-6, abs=1e-6 * abs(mean))
+    log.debug("✓ Running moments match np.mean / np.std")
 
-    except Exception as e:
-        print(f"✗ Distribution histogram creation failed: {e}")
-        return False
 
+def test_visualizer_initialization(visualizer):
+    """Test BootstrapVisualizer initialization."""
+    log.debug("✓ Visualizer initialized")
 
-def test_visualizer_animation_frame() -> bool:
-    """Test creating animation frame."""
-    try:
-        from bootstrap_engine import AnimatedBootstrapODP
-        from visualization import BootstrapVisualizer
+    # Check attributes
+    attrs = ['metadata', 'n_origin', 'n_dev', 'origin_labels', 'dev_labels']
+    _assert_has_all(visualizer, attrs, "attributes")
 
-        engine = AnimatedBootstrapODP(random_state=42)
-        metadata = engine.get_triangle_metadata()
-        visualizer = BootstrapVisualizer(metadata)
 
-        # Run one iteration
-        result = engine.run_single_iteration(0)
+def test_visualizer_triangle_heatmap(metadata, visualizer):
+    """Test creating triangle heatmap visualization."""
+    log.debug("Creating triangle heatmap...")
+    fig = visualizer.create_triangle_heatmap(
+        metadata['actual_incremental'],
+        "Test Triangle"
+    )
+    log.debug("✓ Triangle heatmap created")
+    log.debug(f"  Figure type: {type(fig).__name__}")
 
-        print("Creating animation frame...")
-        fig = visualizer.create_sampling_animation_frame(result, frame_idx=0)
-        print(f"✓ Animation frame created")
 
-        return True
+def test_visualizer_residual_scatter(metadata, visualizer):
+    """Test creating residual pool scatter plot."""
+    log.debug("Creating residual scatter plot...")
+    visualizer.create_residual_pool_scatter(metadata['residual_pool'])
+    log.debug("✓ Residual scatter plot created")
+
 
-    except Exception as e:
-        print(f"✗ Animation frame creation failed: {e}")
-        return False
+def test_visualizer_distribution(bootstrap_summary, metadata, visualizer):
+    """Test creating reserve distribution histogram."""
+    log.debug("Creating distribution histogram...")
+    visualizer.create_reserve_distribution(
+        bootstrap_summary['reserve_estimates'],
+        base_reserve=metadata['base_reserve']
+    )
+    log.debug("✓ Distribution histogram created")
+
+
+def test_visualizer_animation_frame(single_iteration, visualizer):
+    """Test creating animation frame."""
+    log.debug("Creating animation frame...")
+    visualizer.create_sampling_animation_frame(single_iteration, frame_idx=0)
+    log.debug("✓ Animation frame created")
 
 
-def test_dash_app_creation() -> bool:
+def test_dash_app_creation():
     """Test creating Dash application."""
-    try:
-        import dash
-        import dash_bootstrap_components as dbc
+    import dash
+    import dash_bootstrap_components as dbc
 
-        print("Creating Dash app...")
-        app = dash.Dash(
-            __name__,
-            external_stylesheets=[dbc.themes.BOOTSTRAP],
-            suppress_callback_exceptions=True
-        )
-        print(f"✓ Dash app created")
-        print(f"  App type: {type(app).__name__}")
+    log.debug("Creating Dash app...")
+    app = dash.Dash(
+        __name__,
+        external_stylesheets=[dbc.themes.BOOTSTRAP],
+        suppress_callback_exceptions=True
+    )
+    log.debug("✓ Dash app created")
+    log.debug(f"  App type: {type(app).__name__}")
 
-        return True
 
-    except Exception as e:
-        print(f"✗ Dash app creation failed: {e}")
-        return False
+@pytest.mark.skipif(shutil.which('node') is None, reason="node is not on PATH")
+def test_browser_speed_interval_matches_python():
+    """Test that the generated browser speed callback matches compute_interval."""
+    from callbacks import UPDATE_INTERVAL_SPEED_JS, compute_interval
 
+    speeds = [round(0.1 * tenths, 1) for tenths in range(1, 101)]
+    script = (UPDATE_INTERVAL_SPEED_JS
+              + f"console.log(JSON.stringify({json.dumps(speeds)}.map(update_interval_speed)));")
+    result = subprocess.run(['node', '-e', script], capture_output=True, text=True, check=True)
+
+    assert json.loads(result.stdout) == [compute_interval(speed) for speed in speeds]
+    log.debug(f"✓ Browser and Python intervals agree for {len(speeds)} speeds")
 
-def test_file_existence() -> bool:
-    """Test that all required files exist."""
-    import os
 
+def test_file_existence():
+    """Test that all required files exist."""
     required_files = [
         'app.py',
         'bootstrap_engine.py',
@@ -587,70 +419,18 @@ def test_file_existence() -> bool:
         'START_HERE.md'
     ]
 
-    print("Checking required files...")
-    all_exist = True
+    # One directory listing per directory instead of a stat per file
+    present = {entry.name for entry in os.scandir(APP_DIR)}
+    if 'assets' in present:
+        present |= {f"assets/{entry.name}" for entry in os.scandir(os.path.join(APP_DIR, 'assets'))}
+
+    log.debug("Checking required files...")
+    missing = [filename for filename in required_files if filename not in present]
     for filename in required_files:
-        if os.path.exists(filename):
-            print(f"✓ {filename}")
-        else:
-            print(f"✗ Missing: {filename}")
-            all_exist = False
+        log.debug(f"✓ {filename}" if filename in present else f"✗ Missing: {filename}")
 
-    print("\nChecking optional files...")
+    log.debug("Checking optional files...")
     for filename in optional_files:
-        if os.path.exists(filename):
-            print(f"✓ {filename}")
-        else:
-            print(f"⚠️  Optional file not found: {filename}")
-
-    return all_exist
-
-
-def main():
-    """Run all tests."""
-    print("\n" + "="*70)
-    print("BOOTSTRAP ANIMATION - COMPREHENSIVE TEST SUITE")
-    print("="*70)
-    print("\nThis test suite will verify that all components are working correctly.")
-    print("Detailed error messages will help identify and fix any issues.\n")
-
-    runner = TestRunner()
-
-    # Run tests in order
-    tests = [
-        ("Python Version Check", test_python_version),
-        ("Standard Library Imports", test_import_standard_libs),
-        ("NumPy Import & Functionality", test_import_numpy),
-        ("Pandas Import & Functionality", test_import_pandas),
-        ("Chainladder Import & Functionality", test_import_chainladder),
-        ("Plotly Import & Functionality", test_import_plotly),
-        ("Dash Import & Functionality", test_import_dash),
-        ("Dash Bootstrap Components Import", test_import_dash_bootstrap),
-        ("Bootstrap Engine Module Import", test_bootstrap_engine_import),
-        ("Visualization Module Import", test_visualization_import),
-        ("Callbacks Module Import", test_callbacks_import),
-        ("File Existence Check", test_file_existence),
-        ("Bootstrap Engine Initialization", test_bootstrap_engine_initialization),
-        ("Bootstrap Engine Metadata", test_bootstrap_engine_metadata),
-        ("Bootstrap Single Iteration", test_bootstrap_single_iteration),
-        ("Bootstrap Multiple Iterations", test_bootstrap_multiple_iterations),
-        ("Visualizer Initialization", test_visualizer_initialization),
-        ("Visualizer Triangle Heatmap", test_visualizer_triangle_heatmap),
-        ("Visualizer Residual Scatter", test_visualizer_residual_scatter),
-        ("Visualizer Distribution", test_visualizer_distribution),
-        ("Visualizer Animation Frame", test_visualizer_animation_frame),
-        ("Dash App Creation", test_dash_app_creation),
-    ]
-
-    for test_name, test_func in tests:
-        runner.run_test(test_name, test_func)
-
-    # Print summary
-    success = runner.print_summary()
-
-    # Exit with appropriate code
-    sys.exit(0 if success else 1)
-
+        log.debug(f"✓ {filename}" if filename in present else f"⚠️  Optional file not found: {filename}")
 
-if __name__ == '__main__':
-    main()
+    assert not missing, f"Missing required files: {missing}"
@@ -3,8 +3,27 @@ Test Suite for Animation Speed Functionality
 Tests interval calculation and performance at various speeds
 """
 
+import json
 import sys
 
+from callbacks import BASE_INTERVAL, compute_interval, min_interval_for_speed
+
+# Expected (minimum, final) interval in ms per speed, written out by hand from the
+# 100/80/60/50/40 ms ladder so the table in callbacks is checked, not copied
+EXPECTED_INTERVALS = {
+    0.1: (40, 3000),
+    0.5: (40, 600),
+    1.0: (40, 300),
+    1.9: (40, 157),
+    2.0: (50, 150),
+    3.0: (60, 100),
+    5.0: (80, 80),
+    7.0: (100, 100),
+    7.5: (100, 100),
+    8.0: (100, 100),
+    10.0: (100, 100),
+}
+
 
 def test_speed_interval_calculation():
     """Test that interval calculation works correctly at all speeds."""
@@ -13,9 +32,9 @@ def test_speed_interval_calculation():
     print("="*70)
 
     # Import the speed calculation logic (UPDATED VALUES)
-    base_interval = 300
+    base_interval = BASE_INTERVAL
 
-    test_speeds = [0.1, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 7.5, 8.0, 10.0]
+    test_speeds = sorted(EXPECTED_INTERVALS)
 
     print("\nSpeed | Calculated | Minimum | Final Interval | Frames/sec")
     print("-" * 70)
@@ -27,23 +46,18 @@ def test_speed_interval_calculation():
         interval = int(base_interval / speed)
 
         # Apply minimum based on speed (UPDATED LOGIC)
-        if speed >= 7:
-            min_interval = 100
-        elif speed >= 5:
-            min_interval = 80
-        elif speed >= 3:
-            min_interval = 60
-        elif speed >= 2:
-            min_interval = 50
-        else:
-            min_interval = 40
+        min_interval = min_interval_for_speed(speed)
 
-        final_interval = max(min_interval, interval)
+        final_interval = compute_interval(speed)
         frames_per_sec = 1000 / final_interval
 
         print(f"{speed:5.1f} | {interval:10d} | {min_interval:7d} | {final_interval:14d} | {frames_per_sec:10.1f}")
 
         # Validate
+        if (min_interval, final_interval) != EXPECTED_INTERVALS[speed]:
+            print(f"  ✗ FAIL: Expected (minimum, final) {EXPECTED_INTERVALS[speed]}")
+            all_passed = False
+
         if final_interval < min_interval:
             print(f"  ✗ FAIL: Final interval {final_interval} < minimum {min_interval}")
             all_passed = False
@@ -70,8 +84,6 @@ def test_speed_performance_theory():
     print("TEST: Theoretical Performance Analysis")
     print("="*70)
 
-    base_interval = 300  # UPDATED
-
     # Simulate a typical scenario: 55 cells per iteration, 100 iterations
     cells_per_iteration = 55
     n_iterations = 100
@@ -83,21 +95,8 @@ def test_speed_performance_theory():
     test_speeds = [0.1, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 7.5, 8.0, 10.0]
 
     for speed in test_speeds:
-        interval = int(base_interval / speed)
-
         # UPDATED LOGIC
-        if speed >= 7:
-            min_interval = 100
-        elif speed >= 5:
-            min_interval = 80
-        elif speed >= 3:
-            min_interval = 60
-        elif speed >= 2:
-            min_interval = 50
-        else:
-            min_interval = 40
-
-        final_interval = max(min_interval, interval)
+        final_interval = compute_interval(speed)
 
         # Calculate times
         time_per_cell_ms = final_interval
@@ -118,32 +117,19 @@ def test_callback_import():
     print("TEST: Callback Import")
     print("="*70)
 
-    try:
-        sys.path.insert(0, '/Users/davidiruegas/Bootstrapping/bootstrap_animation')
-        from callbacks import register_callbacks
-        print("✓ callbacks module imported successfully")
+    import callbacks
+    print("✓ callbacks module imported successfully")
 
-        # Check that the function exists
-        import inspect
-        source = inspect.getsource(register_callbacks)
+    # Check that the function exists. It is a clientside callback, whose
+    # JavaScript callbacks generates from its speed table
+    js = callbacks.UPDATE_INTERVAL_SPEED_JS
 
-        if 'update_interval_speed' in source:
-            print("✓ update_interval_speed function found in callbacks")
-        else:
-            print("✗ update_interval_speed function not found")
-            return False
-
-        if 'min_interval' in source:
-            print("✓ min_interval logic present")
-        else:
-            print("✗ min_interval logic missing")
-            return False
-
-        return True
+    assert 'function update_interval_speed' in js, "update_interval_speed function not found"
+    print("✓ update_interval_speed function found in callbacks")
 
-    except Exception as e:
-        print(f"✗ Failed to import callbacks: {e}")
-        return False
+    assert json.dumps(callbacks.SPEED_THRESHOLDS) in js and json.dumps(callbacks.MIN_INTERVALS) in js, \
+        "min_interval logic missing"
+    print("✓ min_interval logic present (generated from the speed table)")
 
 
 def test_interval_never_too_low():
@@ -152,7 +138,7 @@ def test_interval_never_too_low():
     print("TEST: Interval Safety Threshold")
     print("="*70)
 
-    base_interval = 300  # UPDATED
+    base_interval = BASE_INTERVAL  # UPDATED
     unsafe_threshold = 40  # UPDATED - below this with heavy callbacks = freeze
 
     print(f"\nTesting all speeds from 0.1 to 10.0 (step 0.1)")
@@ -165,21 +151,8 @@ def test_interval_never_too_low():
         speed = speed_tenths / 10.0
         speeds_tested += 1
 
-        interval = int(base_interval / speed)
-
         # UPDATED LOGIC
-        if speed >= 7:
-            min_interval = 100
-        elif speed >= 5:
-            min_interval = 80
-        elif speed >= 3:
-            min_interval = 60
-        elif speed >= 2:
-            min_interval = 50
-        else:
-            min_interval = 40
-
-        final_interval = max(min_interval, interval)
+        final_interval = compute_interval(speed, base_interval)
 
         if final_interval < unsafe_threshold:
             print(f"✗ UNSAFE: Speed {speed:.1f}x → interval {final_interval}ms < {unsafe_threshold}ms")
@@ -199,8 +172,6 @@ def test_high_speed_performance():
     print("TEST: High-Speed Scenarios (Previously Problematic)")
     print("="*70)
 
-    base_interval = 300  # UPDATED
-
     problem_speeds = [7.0, 7.5, 8.0, 9.0, 10.0]
 
     print("\nTesting speeds that previously caused freezing:")
@@ -214,14 +185,7 @@ def test_high_speed_performance():
         old_interval = max(10, int(100 / speed))
 
         # New calculation (fixed)
-        interval = int(base_interval / speed)
-        if speed >= 7:
-            min_interval = 100  # UPDATED
-        elif speed >= 5:
-            min_interval = 80
-        else:
-            min_interval = 40
-        new_interval = max(min_interval, interval)
+        new_interval = compute_interval(speed)  # UPDATED
 
         # Determine status
         if old_interval < 40:
@@ -310,7 +274,8 @@ def main():
 
     for test_name, test_func in tests:
         try:
-            if test_func():
+            # Tests return False on failure; assertion-based tests return None
+            if test_func() is not False:
                 passed += 1
             else:
                 failed += 1
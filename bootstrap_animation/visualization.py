@@ -3,11 +3,32 @@ Visualization module for bootstrap animation
 Creates beautiful Plotly figures for the Dash application
 """
 
+import functools
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+
+# Annotation of a sampling animation frame, filled from one sampling detail
+_SAMPLING_ANNOTATION = (
+    "Cell ({origin}, {dev})<br>"
+    "Fitted: {fitted_k:,.0f} ($000s)<br>"
+    "Residual: {sampled_residual:.2f}<br>"
+    "Sampled from: ({sampled_from_origin}, {sampled_from_dev})<br>"
+    "Bootstrap: {bootstrap_k:,.0f} ($000s)"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _template_json(name: str) -> Dict:
+    """Resolved layout template, as graph_objects would embed it."""
+    return pio.templates[name].to_plotly_json()
+
+
+@functools.lru_cache(maxsize=None)
+def _colorscale_json(name: str) -> List:
+    """Named colorscale expanded to [position, color] pairs, as graph_objects would."""
+    return go.Heatmap(colorscale=name).colorscale
 
 
 class BootstrapVisualizer:
@@ -28,6 +49,93 @@ class BootstrapVisualizer:
         self.origin_labels = metadata['origin_labels']
         self.dev_labels = metadata['development_labels']
 
+        # Cells below the latest diagonal (future periods), masked in every triangle
+        self._future_mask = np.add.outer(np.arange(self.n_origin), np.arange(self.n_dev)) >= self.n_origin
+
+        # Position of each observed cell in the sampling sequence, which visits them
+        # row by row; future cells are never sampled
+        sequence = np.cumsum(~self._future_mask).reshape(self._future_mask.shape) - 1
+        self._sampling_sequence = np.where(self._future_mask, self._future_mask.size, sequence)
+
+        # Layout of every figure of a kind, built once; figures add their title
+        white = _template_json('plotly_white')
+        xaxis, yaxis = self._triangle_axes()
+        self._triangle_layout = {
+            'template': white,
+            'xaxis': dict(xaxis, title={'text': 'Development Period'}),
+            'yaxis': dict(yaxis, title={'text': 'Accident Year'}),
+            'font': {'size': 11},
+            'height': 400,
+            'uirevision': 'triangle'
+        }
+        self._residual_layout = {
+            'template': white,
+            'title': {'text': 'Residual Pool', 'x': 0.5, 'xanchor': 'center'},
+            'xaxis': {'title': {'text': 'Residual Index'}},
+            'yaxis': {'title': {'text': 'Adjusted Pearson Residual'}},
+            'height': 300,
+            'showlegend': False,
+            # Dashed zero line across the plot
+            'shapes': [{
+                'type': 'line',
+                'xref': 'x domain', 'x0': 0, 'x1': 1,
+                'yref': 'y', 'y0': 0, 'y1': 0,
+                'line': {'color': 'gray', 'dash': 'dash'},
+                'opacity': 0.5
+            }]
+        }
+        self._distribution_layout = {
+            'template': white,
+            'xaxis': {'title': {'text': 'Reserve Estimate'}},
+            'yaxis': {'title': {'text': 'Frequency'}},
+            'height': 350
+        }
+        self._statistics_layout = {
+            'template': white,
+            'xaxis': {'title': {'text': 'Iteration'}},
+            'yaxis': {'title': {'text': 'Reserve Estimate'}},
+            'height': 300,
+            'showlegend': True,
+            'legend': {'x': 0.7, 'y': 1}
+        }
+
+    def _triangle_axes(self) -> Tuple[Dict, Dict]:
+        """
+        Fixed x/y axis settings for triangle heatmaps.
+
+        Labels are numeric strings, so the axes are declared categorical (cells and
+        outlines then share index coordinates) and their ranges are given up front,
+        with the y-axis reversed so the oldest origin is at the top.
+        """
+        xaxis = {'type': 'category', 'range': [-0.5, self.n_dev - 0.5], 'side': 'top'}
+        yaxis = {'type': 'category', 'range': [self.n_origin - 0.5, -0.5]}
+        return xaxis, yaxis
+
+    @staticmethod
+    def _figure(data: List[Dict], layout: Dict, fast: bool) -> Union[go.Figure, Dict]:
+        """Figure from plain trace and layout dicts: as-is when fast, else validated into a go.Figure."""
+        figure = {'data': data, 'layout': layout}
+        return figure if fast else go.Figure(figure)
+
+    @staticmethod
+    def _z_range(values: np.ndarray) -> Tuple[Optional[float], Optional[float]]:
+        """Colour range of the finite values, or (None, None) to leave it automatic."""
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            return None, None
+        return float(finite.min()), float(finite.max())
+
+    @staticmethod
+    def _cell_text(scaled_data: np.ndarray, text_format: str) -> np.ndarray:
+        """Cell labels of a triangle, blank where the value is NaN."""
+        flat = scaled_data.ravel()
+        valid = ~np.isnan(flat)
+
+        text_flat = np.full(flat.size, '', dtype=object)
+        text_flat[valid] = [text_format.format(value) for value in flat[valid].tolist()]
+
+        return text_flat.reshape(scaled_data.shape)
+
     def create_triangle_heatmap(
         self,
         data: np.ndarray,
@@ -38,8 +146,9 @@ class BootstrapVisualizer:
         text_format: str = "{:,.0f}",
         hover_format: str = "{:,.0f}",
         colorbar_title: str = "Value",
-        hover_suffix: str = ""
-    ) -> go.Figure:
+        hover_suffix: str = "",
+        fast: bool = False
+    ) -> Union[go.Figure, Dict]:
         """
         Create a heatmap visualization of a triangle.
 
@@ -53,83 +162,89 @@ class BootstrapVisualizer:
             List of (origin, dev) cells to highlight
         colorscale : str
             Plotly colorscale name
+        hover_format : str
+            "{:spec}" format of hover values, applied in the browser by d3-format
+        fast : bool
+            Return the figure as a plain dict, skipping graph_objects validation
 
         Returns:
         --------
-        go.Figure
+        go.Figure, or the equivalent figure dict when fast=True
         """
         # Mask lower triangle (future periods)
         masked_data = np.array(data, dtype=float, copy=True)
-        for i in range(self.n_origin):
-            for j in range(self.n_dev):
-                if i + j >= self.n_origin:
-                    masked_data[i, j] = np.nan
+        masked_data[self._future_mask] = np.nan
 
         divisor = value_divisor if value_divisor not in (0, None) else 1.0
         scaled_data = masked_data / divisor
 
-        text_data = np.empty(scaled_data.shape, dtype=object)
-        hover_data = np.empty(scaled_data.shape, dtype=object)
-        for i in range(self.n_origin):
-            for j in range(self.n_dev):
-                if np.isnan(scaled_data[i, j]):
-                    text_data[i, j] = ''
-                    hover_data[i, j] = ''
-                else:
-                    text_data[i, j] = text_format.format(scaled_data[i, j])
-                    hover_value = hover_format.format(scaled_data[i, j])
-                    hover_data[i, j] = f"{hover_value}{hover_suffix}"
+        text_data = self._cell_text(scaled_data, text_format)
 
         colorbar_title_to_use = colorbar_title
         if colorbar_title == "Value" and value_divisor == 1000:
             colorbar_title_to_use = "$000s"
 
-        # Create base heatmap
-        fig = go.Figure(data=go.Heatmap(
-            z=scaled_data,
-            x=self.dev_labels,
-            y=self.origin_labels,
-            colorscale=colorscale,
-            text=text_data,
-            customdata=hover_data,
-            texttemplate='%{text}',
-            textfont={"size": 10},
-            hovertemplate='Origin: %{y}<br>Development: %{x}<br>Value: %{customdata}<extra></extra>',
-            showscale=True,
-            colorbar=dict(title=colorbar_title_to_use)
-        ))
-
-        # Reverse y-axis so oldest years are at top (ascending order going down)
-        fig.update_yaxes(autorange="reversed")
-
-        # Add highlighted cells overlay
-        if highlighted_cells:
-            for origin, dev in highlighted_cells:
-                fig.add_shape(
-                    type="rect",
-                    x0=dev - 0.5, x1=dev + 0.5,
-                    y0=origin - 0.5, y1=origin + 0.5,
-                    line=dict(color="red", width=3),
-                    fillcolor="rgba(255, 0, 0, 0.2)"
-                )
-
-        fig.update_layout(
-            title=dict(text=title, x=0.5, xanchor='center'),
-            xaxis_title="Development Period",
-            yaxis_title="Accident Year",
-            xaxis=dict(side='top'),  # Put x-axis labels on top
-            height=400,
-            template='plotly_white',
-            font=dict(size=11)
+        zmin, zmax = self._z_range(scaled_data)
+
+        heatmap = self._heatmap_trace(
+            scaled_data, text_data, colorscale, colorbar_title_to_use, zmin, zmax,
+            hover_format=hover_format, hover_suffix=hover_suffix
         )
 
-        return fig
+        layout = dict(self._triangle_layout, title={'text': title, 'x': 0.5, 'xanchor': 'center'})
+
+        # Add highlighted cells overlay, the outlines sharing one style
+        if highlighted_cells:
+            style = {'type': 'rect', 'line': {'color': 'red', 'width': 3}, 'fillcolor': 'rgba(255, 0, 0, 0.2)'}
+            layout['shapes'] = [
+                dict(style, x0=dev - 0.5, x1=dev + 0.5, y0=origin - 0.5, y1=origin + 0.5)
+                for origin, dev in highlighted_cells
+            ]
+
+        return self._figure([heatmap], layout, fast)
+
+    def _heatmap_trace(
+        self,
+        scaled_data: np.ndarray,
+        text_data: np.ndarray,
+        colorscale: str,
+        colorbar_title: str,
+        zmin: Optional[float],
+        zmax: Optional[float],
+        hover_format: str = "{:,.0f}",
+        hover_suffix: str = ""
+    ) -> Dict:
+        """
+        Heatmap trace of a triangle over the development/origin labels.
+
+        Hover values are formatted in the browser from z: hover_format is a
+        "{:spec}" format whose spec d3-format reads the same way (e.g. ",.0f").
+        """
+        hover_value = f"%{{z:{hover_format[2:-1]}}}{hover_suffix}"
+        heatmap = {
+            'type': 'heatmap',
+            'z': scaled_data.tolist(),  # nested lists, so single cells can be patched
+            'x': list(self.dev_labels),
+            'y': list(self.origin_labels),
+            'colorscale': _colorscale_json(colorscale),
+            'text': text_data.tolist(),
+            'texttemplate': '%{text}',
+            'textfont': {'size': 10},
+            'hovertemplate': f'Origin: %{{y}}<br>Development: %{{x}}<br>Value: {hover_value}<extra></extra>',
+            'hoverongaps': False,  # no hover label on masked cells
+            'showscale': True,
+            'colorbar': {'title': {'text': colorbar_title}}
+        }
+        if zmin is not None:
+            heatmap.update(zmin=zmin, zmax=zmax)
+        return heatmap
 
     def create_residual_pool_scatter(
         self,
         residual_pool: List[Dict],
-        highlighted_idx: Optional[int] = None
-    ) -> go.Figure:
+        highlighted_idx: Optional[int] = None,
+        fast: bool = False
+    ) -> Union[go.Figure, Dict]:
         """
         Create scatter plot of residual pool.
 
@@ -139,132 +254,147 @@ class BootstrapVisualizer:
             List of residual dictionaries
         highlighted_idx : int, optional
             Index of residual to highlight
+        fast : bool
+            Return the figure as a plain dict, skipping graph_objects validation
 
         Returns:
         --------
-        go.Figure
+        go.Figure, or the equivalent figure dict when fast=True
         """
         residuals = [r['adjusted_residual'] for r in residual_pool]
-        indices = list(range(len(residuals)))
-
-        # Create colors: blue for normal, red for highlighted
-        colors = ['#1f77b4'] * len(residuals)
-        sizes = [8] * len(residuals)
-
-        if highlighted_idx is not None:
-            colors[highlighted_idx] = '#ff0000'
-            sizes[highlighted_idx] = 15
-
-        fig = go.Figure(data=go.Scatter(
-            x=indices,
-            y=residuals,
-            mode='markers',
-            marker=dict(
-                color=colors,
-                size=sizes,
-                opacity=0.6,
-                line=dict(width=1, color='white')
-            ),
-            text=[f"Origin {r['origin']}, Dev {r['dev']}<br>Residual: {r['adjusted_residual']:.2f}"
-                  for r in residual_pool],
-            hovertemplate='%{text}<extra></extra>'
-        ))
-
-        fig.update_layout(
-            title=dict(text="Residual Pool", x=0.5, xanchor='center'),
-            xaxis_title="Residual Index",
-            yaxis_title="Adjusted Pearson Residual",
-            height=300,
-            template='plotly_white',
-            showlegend=False
-        )
-
-        fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
+        texts = [f"Origin {r['origin']}, Dev {r['dev']}<br>Residual: {residual:.2f}"
+                 for r, residual in zip(residual_pool, residuals)]
+
+        # Every residual in blue, with the highlighted one (if any) drawn over it
+        # in red by a second trace, so moving the highlight only touches that trace
+        highlighted = [highlighted_idx] if highlighted_idx is not None else []
+        traces = [
+            {
+                'type': 'scatter',
+                'x': x,
+                'y': [residuals[i] for i in x],
+                'mode': 'markers',
+                'marker': {'color': color, 'size': size, 'opacity': 0.6, 'line': {'width': 1, 'color': 'white'}},
+                'text': [texts[i] for i in x],
+                'hovertemplate': '%{text}<extra></extra>'
+            }
+            for x, color, size in (
+                (list(range(len(residuals))), '#1f77b4', 8),
+                (highlighted, '#ff0000', 15)
+            )
+        ]
 
-        return fig
+        return self._figure(traces, dict(self._residual_layout), fast)
 
     def create_reserve_distribution(
         self,
-        reserve_estimates: List[float],
+        reserve_estimates: np.ndarray,
         current_estimate: Optional[float] = None,
-        base_reserve: Optional[float] = None
-    ) -> go.Figure:
+        base_reserve: Optional[float] = None,
+        fast: bool = False
+    ) -> Union[go.Figure, Dict]:
         """
         Create histogram of reserve estimates.
 
         Parameters:
         -----------
-        reserve_estimates : List[float]
-            List of reserve estimates from bootstrap iterations
+        reserve_estimates : np.ndarray
+            Reserve estimates from bootstrap iterations (copied into the figure)
         current_estimate : float, optional
             Current iteration's estimate to highlight
         base_reserve : float, optional
             Base chain ladder reserve estimate
+        fast : bool
+            Return the figure as a plain dict, skipping graph_objects validation
 
         Returns:
         --------
-        go.Figure
+        go.Figure, or the equivalent figure dict when fast=True
         """
         if len(reserve_estimates) == 0:
             # Empty plot
-            fig = go.Figure()
-            fig.update_layout(
-                title="Reserve Distribution (No data yet)",
-                xaxis_title="Reserve Estimate",
-                yaxis_title="Frequency",
-                height=350,
-                template='plotly_white'
-            )
-            return fig
-
-        fig = go.Figure()
+            layout = dict(self._distribution_layout, title={'text': "Reserve Distribution (No data yet)"})
+            return self._figure([], layout, fast)
 
         # Histogram
-        fig.add_trace(go.Histogram(
-            x=reserve_estimates,
-            nbinsx=30,
-            name='Bootstrap Distribution',
-            marker_color='rgba(99, 110, 250, 0.7)',
-            hovertemplate='Range: %{x}<br>Count: %{y}<extra></extra>'
-        ))
-
-        # Add base reserve line
-        if base_reserve is not None:
-            fig.add_vline(
-                x=base_reserve,
-                line_dash="dash",
-                line_color="green",
-                annotation_text="Base CL",
-                annotation_position="top"
-            )
-
-        # Add current estimate line
-        if current_estimate is not None:
-            fig.add_vline(
-                x=current_estimate,
-                line_dash="solid",
-                line_color="red",
-                annotation_text="Current",
-                annotation_position="top"
-            )
-
-        fig.update_layout(
-            title=dict(text=f"Reserve Distribution (n={len(reserve_estimates)})", x=0.5, xanchor='center'),
-            xaxis_title="Reserve Estimate",
-            yaxis_title="Frequency",
-            height=350,
-            template='plotly_white',
+        histogram = {
+            'type': 'histogram',
+            'x': np.asarray(reserve_estimates, dtype=float).tolist(),
+            'nbinsx': 30,
+            'name': 'Bootstrap Distribution',
+            'marker': {'color': 'rgba(99, 110, 250, 0.7)'},
+            'hovertemplate': 'Range: %{x}<br>Count: %{y}<extra></extra>'
+        }
+
+        # Base reserve and current estimate lines, labelled above the plot
+        shapes, annotations = [], []
+        for x, dash, color, label in (
+            (base_reserve, 'dash', 'green', 'Base CL'),
+            (current_estimate, 'solid', 'red', 'Current')
+        ):
+            if x is None:
+                continue
+            shapes.append({
+                'type': 'line',
+                'xref': 'x', 'x0': float(x), 'x1': float(x),
+                'yref': 'y domain', 'y0': 0, 'y1': 1,
+                'line': {'color': color, 'dash': dash}
+            })
+            annotations.append({
+                'text': label,
+                'showarrow': False,
+                'xref': 'x', 'x': float(x), 'xanchor': 'center',
+                'yref': 'y domain', 'y': 1, 'yanchor': 'bottom'
+            })
+
+        layout = dict(
+            self._distribution_layout,
+            title={'text': f"Reserve Distribution (n={len(reserve_estimates)})", 'x': 0.5, 'xanchor': 'center'},
             showlegend=False
         )
+        if shapes:
+            layout.update(shapes=shapes, annotations=annotations)
 
-        return fig
+        return self._figure([histogram], layout, fast)
+
+    def prepare_iteration(self, iteration_detail: Dict) -> Dict:
+        """
+        Work shared by every sampling animation frame of an iteration.
+
+        Frames differ only in which cells are filled in and which one is outlined,
+        so the completed triangle, its labels and colour range are computed once.
+
+        Parameters:
+        -----------
+        iteration_detail : Dict
+            Iteration details from AnimatedBootstrapODP
+
+        Returns:
+        --------
+        Dict to pass as create_sampling_animation_frame(..., prepared=...)
+        """
+        # Completed bootstrap triangle in $000s, with unfilled (zero) cells masked
+        bootstrap_incremental = np.asarray(iteration_detail['bootstrap_incremental'], dtype=float)
+        scaled = np.where(bootstrap_incremental == 0, np.nan, bootstrap_incremental) / 1000.0
+
+        # Colour range of the completed iteration, so it stays put while cells fill in
+        zmin, zmax = self._z_range(np.where(self._future_mask, np.nan, scaled))
+
+        return {
+            'scaled': scaled,
+            'text': self._cell_text(scaled, "{:,.0f}"),
+            'zmin': zmin,
+            'zmax': zmax
+        }
 
     def create_sampling_animation_frame(
         self,
         iteration_detail: Dict,
         frame_idx: int,
-        show_triangle: bool = True
-    ) -> go.Figure:
+        show_triangle: bool = True,
+        fast: bool = False,
+        prepared: Optional[Dict] = None
+    ) -> Union[go.Figure, Dict]:
         """
         Create a single animation frame showing the sampling process.
 
@@ -276,11 +406,17 @@ class BootstrapVisualizer:
             Which sample in the sequence to show (0 to n_cells-1)
         show_triangle : bool
             Whether to show the bootstrap triangle being built
+        fast : bool
+            Return the figure as a plain dict, skipping graph_objects validation
+        prepared : Dict, optional
+            prepare_iteration(iteration_detail), when animating many frames
 
         Returns:
         --------
-        go.Figure
+        go.Figure, or the equivalent figure dict when fast=True
         """
+        if prepared is None:
+            prepared = self.prepare_iteration(iteration_detail)
         sampling_details = iteration_detail['sampling_details']
 
         if frame_idx >= len(sampling_details):
@@ -289,103 +425,103 @@ class BootstrapVisualizer:
         # Get current sample
         current_sample = sampling_details[frame_idx]
 
-        # Build partial bootstrap triangle up to this point
-        partial_triangle = np.zeros((self.n_origin, self.n_dev))
-        for i in range(min(frame_idx + 1, len(sampling_details))):
-            sample = sampling_details[i]
-            partial_triangle[sample['origin'], sample['dev']] = sample['bootstrap_value']
-
-        # Mask unfilled cells
-        for i in range(self.n_origin):
-            for j in range(self.n_dev):
-                if i + j >= self.n_origin or partial_triangle[i, j] == 0:
-                    partial_triangle[i, j] = np.nan
+        # Partial bootstrap triangle up to this point: the cells sampled so far
+        # hold their bootstrap values, the others are masked
+        filled = self._sampling_sequence <= frame_idx
+        scaled_triangle = np.where(filled, prepared['scaled'], np.nan)
+        text_data = np.where(filled, prepared['text'], '')
 
         # Create heatmap with current cell highlighted
-        divisor = 1000.0
-        scaled_triangle = partial_triangle / divisor
-
-        text_data = np.empty(scaled_triangle.shape, dtype=object)
-        hover_data = np.empty(scaled_triangle.shape, dtype=object)
-        for i in range(self.n_origin):
-            for j in range(self.n_dev):
-                if np.isnan(scaled_triangle[i, j]):
-                    text_data[i, j] = ''
-                    hover_data[i, j] = ''
-                else:
-                    text_data[i, j] = f"{scaled_triangle[i, j]:,.0f}"
-                    hover_data[i, j] = f"{scaled_triangle[i, j]:,.0f} ($000s)"
-
-        fig = go.Figure(data=go.Heatmap(
-            z=scaled_triangle,
-            x=self.dev_labels,
-            y=self.origin_labels,
-            colorscale='Purples',
-            text=text_data,
-            texttemplate='%{text}',
-            textfont={"size": 10},
-            showscale=True,
-            customdata=hover_data,
-            hovertemplate='Origin: %{y}<br>Development: %{x}<br>Value: %{customdata}<extra></extra>',
-            colorbar=dict(title="$000s")
-        ))
-
-        # Reverse y-axis so oldest years are at top
-        fig.update_yaxes(autorange="reversed")
-
-        # Highlight current cell
-        fig.add_shape(
-            type="rect",
-            x0=current_sample['dev'] - 0.5,
-            x1=current_sample['dev'] + 0.5,
-            y0=current_sample['origin'] - 0.5,
-            y1=current_sample['origin'] + 0.5,
-            line=dict(color="rgba(255, 215, 0, 1)", width=4),
-            fillcolor="rgba(255, 215, 0, 0.3)"
+        heatmap = self._heatmap_trace(
+            scaled_triangle, text_data, 'Purples', "$000s",
+            prepared['zmin'], prepared['zmax'], hover_suffix=" ($000s)"
         )
 
-        # Add annotation for current sample
-        format_thousands = lambda value: f"{value / 1000:,.0f}"
-
-        annotation_text = (
-            f"Cell ({current_sample['origin']}, {current_sample['dev']})<br>"
-            f"Fitted: {format_thousands(current_sample['fitted'])} ($000s)<br>"
-            f"Residual: {current_sample['sampled_residual']:.2f}<br>"
-            f"Sampled from: ({current_sample['sampled_from_origin']}, {current_sample['sampled_from_dev']})<br>"
-            f"Bootstrap: {format_thousands(current_sample['bootstrap_value'])} ($000s)"
+        layout = dict(
+            self._triangle_layout,
+            title={
+                'text': f"Sampling Progress: {frame_idx + 1} / {len(sampling_details)}",
+                'x': 0.5,
+                'xanchor': 'center'
+            },
+            height=500,
+            # Highlight current cell
+            shapes=[{
+                'type': 'rect',
+                'x0': current_sample['dev'] - 0.5,
+                'x1': current_sample['dev'] + 0.5,
+                'y0': current_sample['origin'] - 0.5,
+                'y1': current_sample['origin'] + 0.5,
+                'line': {'color': 'rgba(255, 215, 0, 1)', 'width': 4},
+                'fillcolor': 'rgba(255, 215, 0, 0.3)'
+            }],
+            # Add annotation for current sample
+            annotations=[{
+                'x': 0.5,
+                'y': 1.15,
+                'xref': 'paper',
+                'yref': 'paper',
+                'text': self._sampling_annotation_text(current_sample),
+                'showarrow': False,
+                'font': {'size': 11, 'color': 'black'},
+                'bgcolor': 'rgba(255, 255, 255, 0.8)',
+                'bordercolor': 'gray',
+                'borderwidth': 1,
+                'borderpad': 5
+            }]
         )
 
-        fig.add_annotation(
-            x=0.5,
-            y=1.15,
-            xref="paper",
-            yref="paper",
-            text=annotation_text,
-            showarrow=False,
-            font=dict(size=11, color="black"),
-            bgcolor="rgba(255, 255, 255, 0.8)",
-            bordercolor="gray",
-            borderwidth=1,
-            borderpad=5
-        )
+        return self._figure([heatmap], layout, fast)
 
-        fig.update_layout(
-            title=dict(
-                text=f"Sampling Progress: {frame_idx + 1} / {len(sampling_details)}",
-                x=0.5,
-                xanchor='center'
-            ),
-            xaxis_title="Development Period",
-            yaxis_title="Accident Year",
-            xaxis=dict(side='top'),  # Put x-axis labels on top
-            height=500,
-            template='plotly_white',
-            font=dict(size=11)
+    def _sampling_annotation_text(self, sample: Dict) -> str:
+        """Annotation describing how one bootstrap cell was sampled."""
+        return _SAMPLING_ANNOTATION.format(
+            fitted_k=sample['fitted'] / 1000,
+            bootstrap_k=sample['bootstrap_value'] / 1000,
+            **sample
         )
 
-        return fig
+    def create_sampling_payload(self, iteration_detail: Dict) -> Dict:
+        """
+        Describe an iteration's sampling animation compactly for the browser.
+
+        Holds a template frame plus the per-cell values and labels, so every frame
+        of create_sampling_animation_frame can be assembled client-side.
+
+        Parameters:
+        -----------
+        iteration_detail : Dict
+            Iteration details from AnimatedBootstrapODP
 
-    def create_statistics_panel(self, summary: Dict, current_iteration: int) -> go.Figure:
+        Returns:
+        --------
+        Dict (JSON-serialisable)
+        """
+        sampling_details = iteration_detail['sampling_details']
+        sampling_arrays = iteration_detail['sampling_arrays']
+
+        # Unfilled (zero) cells are masked, as in create_sampling_animation_frame
+        bootstrap_values = sampling_arrays['bootstrap_value']
+        scaled = np.where(bootstrap_values == 0, np.nan, bootstrap_values / 1000.0)
+        valid = ~np.isnan(scaled)
+        texts = self._cell_text(scaled, "{:,.0f}")
+
+        return {
+            'n_origin': self.n_origin,
+            'n_dev': self.n_dev,
+            'cells': np.column_stack((sampling_arrays['origin'], sampling_arrays['dev'])).tolist(),
+            'values': [value if filled else None for value, filled in zip(scaled.tolist(), valid.tolist())],
+            'texts': texts.tolist(),
+            'annotations': [self._sampling_annotation_text(sample) for sample in sampling_details],
+            'figure': self.create_sampling_animation_frame(iteration_detail, 0, fast=True)
+        }
+
+    def create_statistics_panel(
+        self,
+        summary: Dict,
+        current_iteration: int,
+        fast: bool = False
+    ) -> Union[go.Figure, Dict]:
         """
         Create a panel showing statistics as they evolve.
 
@@ -395,50 +531,49 @@ class BootstrapVisualizer:
             Summary statistics from bootstrap run
         current_iteration : int
             Current iteration number
+        fast : bool
+            Return the figure as a plain dict, skipping graph_objects validation
 
         Returns:
         --------
-        go.Figure
+        go.Figure, or the equivalent figure dict when fast=True
         """
-        if len(summary['reserve_estimates']) == 0:
-            return go.Figure()
-
-        # Get rolling statistics
-        reserves = summary['reserve_estimates'][:current_iteration + 1]
+        # Get rolling statistics (a view when reserve_estimates is an array)
+        reserves = np.asarray(summary['reserve_estimates'][:current_iteration + 1], dtype=float)
 
         if len(reserves) == 0:
-            return go.Figure()
-
-        fig = go.Figure()
+            # Blank figure in the default template
+            return self._figure([], {'template': _template_json(pio.templates.default)}, fast)
 
         # Line plot of estimates over iterations
-        fig.add_trace(go.Scatter(
-            y=reserves,
-            mode='lines',
-            name='Reserve Estimate',
-            line=dict(color='rgba(99, 110, 250, 0.5)', width=1),
-            hovertemplate='Iteration: %{x}<br>Reserve: %{y:.0f}<extra></extra>'
-        ))
+        data = [{
+            'type': 'scatter',
+            'y': reserves.tolist(),
+            'mode': 'lines',
+            'name': 'Reserve Estimate',
+            'line': {'color': 'rgba(99, 110, 250, 0.5)', 'width': 1},
+            'hovertemplate': 'Iteration: %{x}<br>Reserve: %{y:.0f}<extra></extra>'
+        }]
 
         # Add rolling mean
         if len(reserves) > 10:
-            rolling_mean = pd.Series(reserves).rolling(window=min(50, len(reserves))).mean()
-            fig.add_trace(go.Scatter(
-                y=rolling_mean,
-                mode='lines',
-                name='Rolling Mean',
-                line=dict(color='red', width=2),
-                hovertemplate='Rolling Mean: %{y:.0f}<extra></extra>'
-            ))
-
-        fig.update_layout(
-            title=dict(text=f"Reserve Convergence (n={len(reserves)})", x=0.5, xanchor='center'),
-            xaxis_title="Iteration",
-            yaxis_title="Reserve Estimate",
-            height=300,
-            template='plotly_white',
-            showlegend=True,
-            legend=dict(x=0.7, y=1)
+            window = min(50, len(reserves))
+            # Box filter over a running sum; points before the first full window stay NaN
+            running = np.cumsum(np.insert(reserves, 0, 0.0))
+            rolling_mean = np.full(len(reserves), np.nan)
+            rolling_mean[window - 1:] = (running[window:] - running[:-window]) / window
+            data.append({
+                'type': 'scatter',
+                'y': rolling_mean.tolist(),
+                'mode': 'lines',
+                'name': 'Rolling Mean',
+                'line': {'color': 'red', 'width': 2},
+                'hovertemplate': 'Rolling Mean: %{y:.0f}<extra></extra>'
+            })
+
+        layout = dict(
+            self._statistics_layout,
+            title={'text': f"Reserve Convergence (n={len(reserves)})", 'x': 0.5, 'xanchor': 'center'}
         )
 
-        return fig
+        return self._figure(data, layout, fast)